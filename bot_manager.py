@@ -287,6 +287,14 @@ class BotManager:
                 if self.client.agentic_engine:
                     await self.client.agentic_engine.shutdown()
 
+            # Both engines share the reactive engine's Anthropic client - close
+            # its connection pool once neither can issue requests
+            if hasattr(self, 'client') and self.client and hasattr(self.client, 'reactive_engine'):
+                try:
+                    await self.client.reactive_engine.anthropic.close()
+                except Exception as e:
+                    logger.error(f"Error closing Anthropic client: {e}")
+
             # Close Discord connection
             if self.client:
                 await self.client.close()
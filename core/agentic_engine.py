@@ -888,7 +888,7 @@ Channel idle time: {await self.get_channel_idle_time(action.channel_id):.1f} hou
                     tool_results = []
                     for content_block in response.content:
                         if content_block.type == "tool_use":
-                            result = self.memory_tool.execute(
+                            result = await self.memory_tool.execute(
                                 content_block.input,
                                 current_server_id=str(guild.id) if guild else None,
                                 current_channel_id=action.channel_id,
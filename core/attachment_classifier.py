@@ -21,6 +21,13 @@ class AttachmentClassifier:
         'archive': {'.zip', '.tar', '.gz', '.rar', '.7z'},
     }
 
+    # Inverted once at import: classify() is one dict lookup per suffix
+    EXTENSION_TO_CATEGORY: Dict[str, str] = {
+        ext: category
+        for category, extensions in EXTENSION_CATEGORIES.items()
+        for ext in extensions
+    }
+
     @staticmethod
     def get_extension(filename: str) -> str:
         """
@@ -47,16 +54,11 @@ class AttachmentClassifier:
         Returns:
             Category string ('image', 'document', 'spreadsheet', 'code', 'archive', 'other')
         """
-        path = Path(filename)
-
-        # Handle double extensions like .tar.gz
-        suffixes = [s.lower() for s in path.suffixes]
-
-        # Check each suffix against categories
-        for suffix in reversed(suffixes):
-            for category, extensions in AttachmentClassifier.EXTENSION_CATEGORIES.items():
-                if suffix in extensions:
-                    return category
+        # Handle double extensions like .tar.gz: last known suffix wins
+        for suffix in reversed(Path(filename).suffixes):
+            category = AttachmentClassifier.EXTENSION_TO_CATEGORY.get(suffix.lower())
+            if category:
+                return category
 
         return 'other'
 
@@ -9,6 +9,7 @@ Builds rich context from Discord messages with:
 - Image processing
 """
 
+import asyncio
 import discord
 import logging
 import re
@@ -338,13 +339,20 @@ CRITICAL: Do NOT narrate your thought process, explain your reasoning, or descri
                 f"{channel_state}\n</channel_state>"
             )
 
-        # Get recent messages (excluding current to avoid duplication)
+        # Get recent messages (excluding current to avoid duplication). For a
+        # reply, the chain is up to 5 Discord fetches - run them alongside the
+        # DB read instead of after it
         channel_id = str(message.channel.id)
-        all_recent = await self.message_memory.get_recent(
+        recent_read = self.message_memory.get_recent(
             channel_id,
             limit=self.config.api.context_messages + 1,
             exclude_message_ids=exclude_message_ids
         )
+        if message.reference:
+            all_recent, reply_chain = await asyncio.gather(
+                recent_read, self._get_reply_chain(message))
+        else:
+            all_recent, reply_chain = await recent_read, []
 
         # Filter out current message (it was just saved to DB)
         recent_messages = [msg for msg in all_recent if msg.message_id != str(message.id)]
@@ -367,24 +375,15 @@ CRITICAL: Do NOT narrate your thought process, explain your reasoning, or descri
             own_id = str(message.guild.me.id) if message.guild else None
 
             # Check if current message is a reply
-            reply_chain = await self._get_reply_chain(message)
             if reply_chain:
-                stats["reply_chain_length"] = len(reply_chain)
-                history_parts.append("## Reply Chain (Oldest to Newest)")
-                history_parts.append("")
-                for msg in reply_chain:
-                    resolved_content, resolved_count = await self._resolve_mentions(msg.content, message.guild)
-                    stats["mentions_resolved"] += resolved_count
-                    if str(msg.author.id) == own_id or (own_id is None and msg.author.bot):
-                        author_display = "Assistant (you)"
-                    else:
-                        author_display = msg.author.display_name
-                    timestamp_str = msg.created_at.strftime('%H:%M')
-                    history_parts.append(f"[{timestamp_str}] **{author_display}**: {resolved_content}")
-                history_parts.append("")
+                history_parts.extend(await self._format_reply_chain(reply_chain, message, stats))
                 history_parts.append("## Recent Messages")
                 history_parts.append("")
 
+            # Attachment listings for the whole window in one query
+            attachments_by_message = await self._attachment_listings(
+                [msg.message_id for msg in recent_messages])
+
             # Add recent messages
             for msg in recent_messages:
                 # Clarify bot's own messages vs user messages
@@ -397,20 +396,10 @@ CRITICAL: Do NOT narrate your thought process, explain your reasoning, or descri
                 resolved_content, resolved_count = await self._resolve_mentions(msg.content, message.guild)
                 stats["mentions_resolved"] += resolved_count
 
-                # Check for attachments if attachment manager is available
                 attachment_info = ""
-                if self.attachment_manager:
-                    try:
-                        async with self.attachment_manager.attachment_db.db.execute(
-                            "SELECT attachment_id, filename FROM attachments WHERE message_id = ?",
-                            (str(msg.message_id),)
-                        ) as cursor:
-                            attachment_rows = await cursor.fetchall()
-                            if attachment_rows:
-                                attachment_strs = [f"{row['filename']} (ID: {row['attachment_id']})" for row in attachment_rows]
-                                attachment_info = f" [Attachments: {', '.join(attachment_strs)}; use get_attachment to retrieve]"
-                    except Exception as e:
-                        logger.debug(f"Failed to query attachments for message {msg.message_id}: {e}")
+                attachment_strs = attachments_by_message.get(str(msg.message_id))
+                if attachment_strs:
+                    attachment_info = f" [Attachments: {', '.join(attachment_strs)}; use get_attachment to retrieve]"
 
                 timestamp_str = msg.timestamp.strftime('%H:%M')
                 history_parts.append(f"[{timestamp_str}] **{author_display}**: {resolved_content}{attachment_info}")
@@ -486,7 +475,9 @@ CRITICAL: Do NOT narrate your thought process, explain your reasoning, or descri
                 )
 
         else:
-            # No history, just current message with context
+            # No history, just current message with context (plus the reply
+            # chain when it is one - the replied-to messages may predate the
+            # stored history)
             resolved_content, resolved_count = await self._resolve_mentions(message.content, message.guild)
             stats["mentions_resolved"] += resolved_count
 
@@ -498,6 +489,11 @@ CRITICAL: Do NOT narrate your thought process, explain your reasoning, or descri
             if has_reactions:
                 stats["reactions_found"] += 1
 
+            if reply_chain:
+                message_with_context = "\n".join(
+                    await self._format_reply_chain(reply_chain, message, stats)
+                    + [message_with_context])
+
             # Process current message attachments
             attachments = await self.process_attachments(message)
 
@@ -759,6 +755,51 @@ CRITICAL: Do NOT narrate your thought process, explain your reasoning, or descri
         from core.attachment_classifier import AttachmentClassifier
         return AttachmentClassifier.image_media_type(filename)
 
+    async def _format_reply_chain(self, reply_chain: List[discord.Message],
+                                  message: discord.Message, stats: dict) -> List[str]:
+        """
+        "## Reply Chain" section lines (ending with a blank line) for the
+        triggering message's history block; updates stats in place.
+        """
+        own_id = str(message.guild.me.id) if message.guild else None
+        stats["reply_chain_length"] = len(reply_chain)
+        lines = ["## Reply Chain (Oldest to Newest)", ""]
+        for msg in reply_chain:
+            resolved_content, resolved_count = await self._resolve_mentions(msg.content, message.guild)
+            stats["mentions_resolved"] += resolved_count
+            if str(msg.author.id) == own_id or (own_id is None and msg.author.bot):
+                author_display = "Assistant (you)"
+            else:
+                author_display = msg.author.display_name
+            timestamp_str = msg.created_at.strftime('%H:%M')
+            lines.append(f"[{timestamp_str}] **{author_display}**: {resolved_content}")
+        lines.append("")
+        return lines
+
+    async def _attachment_listings(self, message_ids: List[str]) -> Dict[str, List[str]]:
+        """
+        "filename (ID: ...)" entries per message for the history listing -
+        one IN query for the whole window rather than one per message.
+        Empty if there is no attachment manager or the lookup fails.
+        """
+        if not self.attachment_manager or not message_ids:
+            return {}
+
+        listings: Dict[str, List[str]] = {}
+        try:
+            placeholders = ",".join("?" * len(message_ids))
+            async with self.attachment_manager.attachment_db.db.execute(
+                f"SELECT message_id, attachment_id, filename FROM attachments "
+                f"WHERE message_id IN ({placeholders})",
+                [str(mid) for mid in message_ids]
+            ) as cursor:
+                async for row in cursor:
+                    listings.setdefault(row["message_id"], []).append(
+                        f"{row['filename']} (ID: {row['attachment_id']})")
+        except Exception as e:
+            logger.debug(f"Failed to query attachments for history window: {e}")
+        return listings
+
     async def _get_reply_chain(self, message: discord.Message) -> List[discord.Message]:
         """
         Follow reply chain backwards to build context.
@@ -851,18 +892,19 @@ CRITICAL: Do NOT narrate your thought process, explain your reasoning, or descri
         if len(message.attachments) > api_limit:
             logger.warning(f"Message has {len(message.attachments)} attachments, limiting to {api_limit}")
 
+        # Attachment manager stores in database + processes, all attachments
+        # at once; results line up with attachments_to_process
+        results = [None] * len(attachments_to_process)
+        if self.attachment_manager:
+            results = await self.attachment_manager.process_attachments(
+                attachments_to_process, message, is_realtime=True
+            )
+
         # Process each attachment
         processed_attachments = []
-        for attachment in attachments_to_process:
+        for attachment, result in zip(attachments_to_process, results):
             try:
                 if self.attachment_manager:
-                    # Use attachment manager (stores in database + processes)
-                    result = await self.attachment_manager.process_attachment(
-                        attachment=attachment,
-                        message=message,
-                        is_realtime=True
-                    )
-
                     if result and result.get("for_api"):
                         api_data = result["for_api"]
 
@@ -9,6 +9,8 @@ import asyncio
 import logging
 from typing import Optional, TYPE_CHECKING
 
+from .internal_constants import BACKFILL_BATCH_SIZE
+
 if TYPE_CHECKING:
     from .config import BotConfig
     from .reactive_engine import ReactiveEngine
@@ -530,14 +532,10 @@ class DiscordClient(discord.Client):
         processed_attachments = []
         if self.reactive_engine.attachment_manager and message.attachments:
             try:
-                for attachment in message.attachments:
-                    result = await self.reactive_engine.attachment_manager.process_attachment(
-                        attachment=attachment,
-                        message=message,
-                        is_realtime=True
-                    )
-                    if result:
-                        processed_attachments.append(result)
+                results = await self.reactive_engine.attachment_manager.process_attachments(
+                    message.attachments, message, is_realtime=True
+                )
+                processed_attachments = [result for result in results if result]
                 logger.info(f"Processed {len(message.attachments)} attachments from message {message.id}")
             except Exception as e:
                 logger.error(f"Error processing attachments: {e}", exc_info=True)
@@ -842,58 +840,74 @@ class DiscordClient(discord.Client):
 
         resume = await self.message_memory.newest_message_times() if incremental else {}
 
+        # First boot on an empty store: load without the per-row FTS
+        # triggers and index everything once at the end
+        bulk_load = incremental and not resume
+        if bulk_load:
+            await self.message_memory.suspend_fts_triggers()
+
         total_messages = 0
         total_channels = 0
         failed_channels = 0
 
-        for guild in self.guilds:
-            # Only backfill configured servers
-            if self.config.discord.servers:
-                if str(guild.id) not in self.config.discord.servers:
-                    continue
-
-            logger.info(f"Backfilling server: {guild.name}")
+        # The triggers must come back however the walk ends - cancelled on
+        # shutdown/reconnect or failed outside a channel - or live writes
+        # stay out of search until the next restart's stale-index check
+        try:
+            for guild in self.guilds:
+                # Only backfill configured servers
+                if self.config.discord.servers:
+                    if str(guild.id) not in self.config.discord.servers:
+                        continue
 
-            async for channel in iter_backfill_channels(guild):
-                try:
-                    channel_messages = 0
-                    logger.debug(f"  Backfilling #{channel.name}...")
-
-                    # Threads met during backfill register their parent mapping
-                    if isinstance(channel, discord.Thread):
-                        await self.message_memory.upsert_thread(
-                            str(channel.id), parent_id=str(channel.parent_id),
-                            name=channel.name, archived=bool(channel.archived))
-
-                    # Resume point: newest stored message wins over the
-                    # window cutoff when it's more recent
-                    after = resume.get(str(channel.id)) or cutoff
-                    if after and cutoff and cutoff > after:
-                        after = cutoff
-
-                    async for message in channel.history(limit=None, after=after):
-                        try:
-                            await self.message_memory.add_message(message)
-                            channel_messages += 1
-                            total_messages += 1
+                logger.info(f"Backfilling server: {guild.name}")
 
-                            # Log progress every 100 messages
-                            if total_messages % 100 == 0:
+                async for channel in iter_backfill_channels(guild):
+                    try:
+                        channel_messages = 0
+                        logger.debug(f"  Backfilling #{channel.name}...")
+
+                        # Threads met during backfill register their parent mapping
+                        if isinstance(channel, discord.Thread):
+                            await self.message_memory.upsert_thread(
+                                str(channel.id), parent_id=str(channel.parent_id),
+                                name=channel.name, archived=bool(channel.archived))
+
+                        # Resume point: newest stored message wins over the
+                        # window cutoff when it's more recent
+                        after = resume.get(str(channel.id)) or cutoff
+                        if after and cutoff and cutoff > after:
+                            after = cutoff
+
+                        # Stored in batches - one transaction per batch instead of
+                        # a commit per message
+                        batch = []
+                        async for message in channel.history(limit=None, after=after):
+                            batch.append(message)
+                            if len(batch) >= BACKFILL_BATCH_SIZE:
+                                stored = await self._store_backfill_batch(batch)
+                                channel_messages += stored
+                                total_messages += stored
+                                batch = []
                                 logger.info(f"  Progress: {total_messages} messages indexed...")
-
-                        except Exception as e:
-                            logger.debug(f"  Skipped message {message.id}: {e}")
-
-                    if channel_messages > 0:
-                        logger.debug(f"  #{channel.name}: {channel_messages} messages")
-                        total_channels += 1
-
-                except discord.Forbidden:
-                    logger.debug(f"  #{channel.name}: No read permission")
-                    failed_channels += 1
-                except Exception as e:
-                    logger.warning(f"  #{channel.name}: {e}")
-                    failed_channels += 1
+                        if batch:
+                            stored = await self._store_backfill_batch(batch)
+                            channel_messages += stored
+                            total_messages += stored
+
+                        if channel_messages > 0:
+                            logger.debug(f"  #{channel.name}: {channel_messages} messages")
+                            total_channels += 1
+
+                    except discord.Forbidden:
+                        logger.debug(f"  #{channel.name}: No read permission")
+                        failed_channels += 1
+                    except Exception as e:
+                        logger.warning(f"  #{channel.name}: {e}")
+                        failed_channels += 1
+        finally:
+            if bulk_load:
+                await self.message_memory.rebuild_fts_index()
 
         logger.info(f"Backfill complete: {total_messages} messages from {total_channels} channels")
         if failed_channels > 0:
@@ -905,6 +919,24 @@ class DiscordClient(discord.Client):
 
         return total_messages
 
+    async def _store_backfill_batch(self, batch: list) -> int:
+        """Store one backfill batch; on failure fall back to per-message
+        stores so one bad message only skips itself. Returns messages stored."""
+        try:
+            await self.message_memory.add_messages(batch)
+            return len(batch)
+        except Exception as e:
+            logger.debug(f"  Batch store failed ({e}), retrying per message")
+
+        stored = 0
+        for message in batch:
+            try:
+                await self.message_memory.add_message(message)
+                stored += 1
+            except Exception as e:
+                logger.debug(f"  Skipped message {message.id}: {e}")
+        return stored
+
     async def _handle_timezone_command(self, message: discord.Message) -> bool:
         """
         Handle timezone setting command (!timezone or !tz).
@@ -1051,6 +1083,12 @@ class DiscordClient(discord.Client):
                 )
                 logger.info(f"Daily re-backfill complete: {total} messages indexed")
 
+                # Keep planner statistics in step with the grown table
+                try:
+                    await self.message_memory.optimize()
+                except Exception as e:
+                    logger.error(f"Message store optimize failed: {e}")
+
                 # Garbage-collect conversation states for long-dead channels
                 if self.reactive_engine.conversation_state_manager:
                     try:
@@ -98,6 +98,23 @@ WEB_SEARCH_CITATIONS_ENABLED = True  # Required for end-user applications
 WEB_SEARCH_MAX_USES = 8  # Per-request cap on search/fetch calls (cost guard)
 
 
+# =============================================================================
+# MESSAGE STORE (Internal)
+# =============================================================================
+BACKFILL_BATCH_SIZE = 1000     # Messages per backfill transaction (10 history pages)
+DEFERRED_COMMIT_DELAY_S = 0.5  # Max age of an uncommitted live message write
+DEFERRED_COMMIT_MAX_OPS = 64   # Queued writes that force an immediate commit
+CLEANUP_BATCH_SIZE = 5000      # Rows per cleanup_old DELETE transaction
+READER_POOL_SIZE = 2           # Read-only connections for search/stats tool queries
+FTS_MERGE_PAGES = 500          # Page budget of one incremental FTS segment merge
+
+
+# =============================================================================
+# ATTACHMENTS (Internal)
+# =============================================================================
+UPLOAD_DEDUP_CACHE_SIZE = 128  # Recent (content hash, filename) -> Files API file_id entries
+
+
 # =============================================================================
 # PROACTIVE ENGAGEMENT (Internal)
 # =============================================================================
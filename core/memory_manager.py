@@ -8,11 +8,31 @@ Bot writes via Claude's memory tool, not this manager.
 import json
 import logging
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Union
+
+try:
+    import orjson
+except ImportError:  # optional - stdlib json is the fallback
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 
+def _dumps(data) -> Union[bytes, str]:
+    """Serialize a memory JSON file (2-space indent either way, so files
+    stay readable through the memory tool)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2)
+
+
+def _loads(content):
+    """Parse memory JSON; orjson.JSONDecodeError subclasses json's."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
 class MemoryManager:
     """
     Path helpers and read access for Anthropic's memory tool.
@@ -25,6 +45,13 @@ class MemoryManager:
         self.bot_id = bot_id
         self.base_path = memory_base_path / bot_id
         self.base_path.mkdir(parents=True, exist_ok=True)
+        # Directories already created by this manager - skips the mkdir walk
+        # on every system write once the tree exists.
+        self._known_dirs: set[Path] = {self.base_path}
+        # Virtual-path prefixes, built once: "/memories/{bot_id}/" and
+        # "/memories/{bot_id}/servers/{server_id}/" per server seen.
+        self._prefix = f"/memories/{bot_id}/"
+        self._server_prefixes: dict[str, str] = {}
         # Set post-construction by bot_manager after MessageMemory exists.
         # Sync callable: channel_id -> parent_id or None.
         self.thread_parent_resolver = None
@@ -33,16 +60,22 @@ class MemoryManager:
 
         logger.info(f"MemoryManager initialized for bot '{bot_id}' at {self.base_path}")
 
+    def _server_prefix(self, server_id: str) -> str:
+        prefix = self._server_prefixes.get(server_id)
+        if prefix is None:
+            prefix = self._server_prefixes[server_id] = f"{self._prefix}servers/{server_id}/"
+        return prefix
+
     def get_global_user_profile_path(self, user_id: str) -> str:
         """One file per human, keyed by Discord user ID (v0.7.0)."""
-        return f"/memories/{self.bot_id}/global/users/{user_id}.md"
+        return f"{self._prefix}global/users/{user_id}.md"
 
     def get_global_users_dir(self) -> Path:
         return self.base_path / "global" / "users"
 
     def get_user_profile_path(self, server_id: str, user_id: str) -> str:
         """Legacy per-server profile path (pre-0.7) - migration + fallback shim only."""
-        return f"/memories/{self.bot_id}/servers/{server_id}/users/{user_id}.md"
+        return f"{self._server_prefix(server_id)}users/{user_id}.md"
 
     def _thread_parent(self, channel_id: str):
         return self.thread_parent_resolver(str(channel_id)) if self.thread_parent_resolver else None
@@ -58,34 +91,34 @@ class MemoryManager:
         their parent: places are local, a thread is part of its parent place;
         a DM belongs to the person, so it lives in the global tree)."""
         if server_id in (None, "DM"):
-            return f"/memories/{self.bot_id}/{self._dm_dir(channel_id)}/notes.md"
+            return f"{self._prefix}{self._dm_dir(channel_id)}/notes.md"
         parent = self._thread_parent(channel_id)
         if parent:
-            return f"/memories/{self.bot_id}/servers/{server_id}/channels/{parent}/threads/{channel_id}.md"
-        return f"/memories/{self.bot_id}/servers/{server_id}/channels/{channel_id}.md"
+            return f"{self._server_prefix(server_id)}channels/{parent}/threads/{channel_id}.md"
+        return f"{self._server_prefix(server_id)}channels/{channel_id}.md"
 
     def get_episodes_dir_path(self, server_id: str, channel_id: str) -> str:
         if server_id in (None, "DM"):
-            return f"/memories/{self.bot_id}/{self._dm_dir(channel_id)}/episodes"
+            return f"{self._prefix}{self._dm_dir(channel_id)}/episodes"
         parent = self._thread_parent(channel_id)
         if parent:
-            return f"/memories/{self.bot_id}/servers/{server_id}/channels/{parent}/threads/{channel_id}/episodes"
-        return f"/memories/{self.bot_id}/servers/{server_id}/channels/{channel_id}/episodes"
+            return f"{self._server_prefix(server_id)}channels/{parent}/threads/{channel_id}/episodes"
+        return f"{self._server_prefix(server_id)}channels/{channel_id}/episodes"
 
     def get_server_culture_path(self, server_id: str) -> str:
         """Standard path for server culture/overview memory file"""
-        return f"/memories/{self.bot_id}/servers/{server_id}/culture.md"
+        return f"{self._server_prefix(server_id)}culture.md"
 
     def get_server_character_path(self, server_id: str) -> str:
         """Operator-authored note declaring what this server IS — its nature and
         social register. Optional, never auto-written (unlike culture.md, which
         the consolidator rewrites). Read by induction and consolidation to steer
         what's worth keeping."""
-        return f"/memories/{self.bot_id}/servers/{server_id}/character.md"
+        return f"{self._server_prefix(server_id)}character.md"
 
     def get_followups_path(self, server_id: str) -> str:
         """Standard path for follow-ups JSON"""
-        return f"/memories/{self.bot_id}/servers/{server_id}/followups.json"
+        return f"{self._server_prefix(server_id)}followups.json"
 
     async def get_followups(self, server_id: str) -> Optional[dict]:
         """Get follow-ups for server, returning empty structure if none exist"""
@@ -99,7 +132,32 @@ class MemoryManager:
 
     def resolve_path(self, path: str):
         """Filesystem path for a /memories/{bot_id}/... virtual path."""
-        return self.base_path / path.replace(f"/memories/{self.bot_id}/", "")
+        # Strip the leading prefix only - replace() would also rewrite a
+        # nested ".../memories/{bot_id}/..." segment further along the path
+        return self.base_path / path.removeprefix(self._prefix)
+
+    def _ensure_dir(self, path: Path) -> None:
+        """mkdir -p, memoized per directory."""
+        if path in self._known_dirs:
+            return
+        path.mkdir(parents=True, exist_ok=True)
+        self._known_dirs.add(path)
+
+    def _write_file(self, file_path: Path, content: Union[str, bytes]) -> None:
+        """Write a file, creating its directory on first use. The memory tool
+        can delete directories behind our back, so a missing parent drops the
+        memo entry and retries once."""
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        self._ensure_dir(file_path.parent)
+        try:
+            with open(file_path, "wb") as f:
+                f.write(content)
+        except FileNotFoundError:
+            self._known_dirs.discard(file_path.parent)
+            self._ensure_dir(file_path.parent)
+            with open(file_path, "wb") as f:
+                f.write(content)
 
     async def write_followups(self, server_id: str, data: dict):
         """
@@ -107,16 +165,18 @@ class MemoryManager:
 
         Used when the system completes follow-ups, not for Claude-initiated creation.
         Claude creates follow-ups via memory tool.
+
+        Always a whole-file rewrite: followups.json is the shared contract
+        with the memory tool (Claude edits it with str_replace) and the
+        dashboard, so a side log would leave both reading stale state. Size
+        stays bounded by cleanup_old_followups' 30-day archive.
         """
         path = self.get_followups_path(server_id)
         file_path = self.resolve_path(path)
 
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-
         try:
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
-            logger.debug(f"Wrote followups to {path}")
+            self._write_file(file_path, _dumps(data))
+            logger.debug("Wrote followups to %s", path)
 
         except Exception as e:
             logger.error(f"Error writing followups to {path}: {e}")
@@ -125,8 +185,8 @@ class MemoryManager:
         """Standard path for channel engagement stats JSON"""
         parent = self._thread_parent(channel_id)
         if parent:
-            return f"/memories/{self.bot_id}/servers/{server_id}/channels/{parent}/threads/{channel_id}_stats.json"
-        return f"/memories/{self.bot_id}/servers/{server_id}/channels/{channel_id}_stats.json"
+            return f"{self._server_prefix(server_id)}channels/{parent}/threads/{channel_id}_stats.json"
+        return f"{self._server_prefix(server_id)}channels/{channel_id}_stats.json"
 
     async def get_engagement_stats(self, server_id: str, channel_id: str) -> dict:
         """Get engagement stats for channel, calculating success rate"""
@@ -140,31 +200,24 @@ class MemoryManager:
                 "successful_attempts": 0,
             }
 
-        total = data.get("total_attempts", 0)
-        successful = data.get("successful_attempts", 0)
+        total = data.setdefault("total_attempts", 0)
+        successful = data.setdefault("successful_attempts", 0)
 
         # Laplace smoothing: stays near the 0.5 prior on few samples, so one
         # ignored message can't blacklist a channel forever (proactive never
         # firing again means the rate could never recover - a death spiral)
-        success_rate = (successful + 1) / (total + 2)
-
-        return {
-            "success_rate": success_rate,
-            "total_attempts": total,
-            "successful_attempts": successful,
-        }
+        # Annotates the freshly parsed dict in place - nothing else holds it.
+        data["success_rate"] = (successful + 1) / (total + 2)
+        return data
 
     async def write_engagement_stats(self, server_id: str, channel_id: str, data: dict):
         """System-level write for engagement tracking"""
         path = self.get_channel_stats_path(server_id, channel_id)
         file_path = self.resolve_path(path)
 
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-
         try:
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
-            logger.debug(f"Wrote engagement stats to {path}")
+            self._write_file(file_path, _dumps(data))
+            logger.debug("Wrote engagement stats to %s", path)
 
         except Exception as e:
             logger.error(f"Error writing engagement stats to {path}: {e}")
@@ -174,16 +227,16 @@ class MemoryManager:
         # Convert memory tool path to filesystem path
         file_path = self.resolve_path(path)
 
-        if not file_path.exists():
-            logger.debug(f"Memory file not found: {path}")
-            return None
-
         try:
             with open(file_path, "r", encoding="utf-8") as f:
                 content = f.read()
-            logger.debug(f"Read memory file: {path} ({len(content)} chars)")
+            logger.debug("Read memory file: %s (%d chars)", path, len(content))
             return content
 
+        except FileNotFoundError:
+            logger.debug("Memory file not found: %s", path)
+            return None
+
         except Exception as e:
             logger.error(f"Error reading memory file {path}: {e}")
             return None
@@ -195,10 +248,8 @@ class MemoryManager:
         Claude writes via the memory tool; this is for framework-owned files.
         """
         file_path = self.resolve_path(path)
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(content)
-        logger.debug(f"Wrote memory file {path}")
+        self._write_file(file_path, content)
+        logger.debug("Wrote memory file %s", path)
 
     async def read_json(self, path: str) -> Optional[dict]:
         """Read and parse JSON memory file, returning None if not found/invalid"""
@@ -207,7 +258,7 @@ class MemoryManager:
             return None
 
         try:
-            data = json.loads(content)
+            data = _loads(content)
             return data
 
         except json.JSONDecodeError as e:
@@ -254,13 +305,13 @@ class MemoryManager:
 
         Ensures path stays within /memories/{bot_id}/ boundary.
         """
-        expected_prefix = f"/memories/{self.bot_id}/"
+        expected_prefix = self._prefix
         if not path.startswith(expected_prefix):
             logger.warning(f"Invalid memory path (wrong prefix): {path}")
             return False
 
         # Convert to filesystem path and check for traversal
-        relative_path = path.replace(expected_prefix, "")
+        relative_path = path[len(expected_prefix):]
         try:
             file_path = (self.base_path / relative_path).resolve()
             base_resolved = self.base_path.resolve()
@@ -303,7 +354,7 @@ class MemoryManager:
 
             # Create server directory
             server_path = self.base_path / "servers" / server_id
-            server_path.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(server_path)
 
             # Create server culture file if it doesn't exist
             culture_file = server_path / "culture.md"
@@ -318,7 +369,7 @@ class MemoryManager:
 
             # Create global user profile skeletons
             users_path = self.get_global_users_dir()
-            users_path.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(users_path)
 
             for user_id in users:
                 user_file = users_path / f"{user_id}.md"
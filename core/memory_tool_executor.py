@@ -7,7 +7,13 @@ Reference: docs/api_memory_tool.md
 Operations: view, create, str_replace, insert, delete, rename
 """
 
+import asyncio
+import itertools
 import logging
+import mmap
+import os
+import re
+import stat
 from pathlib import Path
 from typing import Dict, Any, Optional
 import shutil
@@ -16,6 +22,99 @@ from .vaults import VaultEnforcer
 
 logger = logging.getLogger(__name__)
 
+# Directory memo per bot tree, shared by every executor in the process (the
+# reactive and agentic engines each hold one) so a delete through either
+# invalidates it for both. One bot runs per process, so this stays small.
+_known_dirs_by_tree: Dict[Path, set] = {}
+
+# Cap on memoized memory-path -> filesystem-path translations per executor
+_FS_PATH_CACHE_MAX = 512
+
+# Full views of files at least this big drop their pages from the OS cache
+# afterwards, so one-off reads of large notes don't evict the message DB
+_UNCACHED_VIEW_MIN_BYTES = 64 * 1024
+
+# str_replace splices in place only for files at least this big; smaller ones
+# take the plain read/replace/write, where the saving doesn't matter
+_SPLICE_MIN_BYTES = 64 * 1024
+
+
+def _splice_file(fs_path: Path, old: bytes, new: bytes) -> bool:
+    """
+    Replace the first occurrence of old with new, in place.
+
+    The file is mapped rather than read and rewritten whole: only the bytes
+    after the match move, and an equal-length edit touches nothing else.
+    Unlike a rewrite this isn't crash-safe - dying mid-move leaves the tail
+    half-shifted - so it's reserved for files of _SPLICE_MIN_BYTES and up.
+
+    Returns False (file untouched) when the file is below that size, old
+    isn't found byte-for-byte, or the edit grows the file on a platform
+    without mremap (macOS/BSD) - the caller then does a text-mode rewrite.
+    """
+    with open(fs_path, 'r+b') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < _SPLICE_MIN_BYTES:
+            return False
+        with mmap.mmap(f.fileno(), 0) as mm:
+            idx = mm.find(old)
+            if idx < 0:
+                return False
+            tail = idx + len(old)
+            delta = len(new) - len(old)
+            if delta > 0:
+                try:
+                    mm.resize(size + delta)  # grows the file too
+                except (SystemError, OSError):
+                    # No mremap(): raised before the file is touched
+                    return False
+                mm.move(tail + delta, tail, size - tail)
+            elif delta < 0:
+                mm.move(tail + delta, tail, size - tail)
+            mm[idx:idx + len(new)] = new
+            mm.flush()
+        if delta < 0:
+            # Shrink once unmapped - a map can't be resized down to zero
+            f.truncate(size + delta)
+    return True
+
+
+def _read_text(fs_path: Path) -> str:
+    """open/read/close in one go - a single worker-thread hop per read."""
+    with open(fs_path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def _write_text(fs_path: Path, text: str) -> None:
+    """open/write/close in one go - a single worker-thread hop per write."""
+    with open(fs_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def _read_text_uncached(fs_path: Path) -> str:
+    """Read a whole text file, then advise the kernel to drop its pages."""
+    with open(fs_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+        if hasattr(os, "posix_fadvise"):  # not on Windows/macOS
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+    return content
+
+
+def _insert_line(fs_path: Path, index: int, text: str) -> None:
+    """Insert text as a line before 0-indexed line index, in one hop."""
+    with open(fs_path, 'r', encoding='utf-8') as f:
+        lines = f.readlines()
+    lines.insert(index, text + "\n")
+    with open(fs_path, 'w', encoding='utf-8') as f:
+        f.writelines(lines)
+
+
+def _read_line_range(fs_path: Path, start: int, end: int) -> str:
+    """Lines start..end (1-indexed, inclusive; end -1 = to EOF), reading no further than end."""
+    with open(fs_path, 'r', encoding='utf-8') as f:
+        selected = itertools.islice(f, max(start - 1, 0), end if end >= 0 else None)
+        return "".join(selected).removesuffix("\n")
+
 
 class MemoryToolExecutor:
     """
@@ -35,10 +134,24 @@ class MemoryToolExecutor:
         self.base_path = memory_base_path / bot_id
         self.base_path.mkdir(parents=True, exist_ok=True)
         self.vaults = vaults
+        self._base_resolved = self.base_path.resolve()
+        self._bot_prefix = f"/memories/{bot_id}"
+        self._bot_prefix_len = len(self._bot_prefix) + 1  # incl. trailing "/"
+        # Memory path -> filesystem Path. Pure string mapping, so it never
+        # needs invalidating; existence is always checked against the disk
+        # since consolidation, episodes and the dashboard write here too.
+        self._fs_path_cache: Dict[str, Path] = {}
+        # /memories/{bot_id} exactly, or anything under it
+        self._path_re = re.compile(rf"/memories/{re.escape(bot_id)}(?:/|\Z)")
+        # Directories known to exist - skips the mkdir walk on every write.
+        # Dropped on delete/rename so a removed tree is recreated on demand.
+        self._known_dirs: set[Path] = _known_dirs_by_tree.setdefault(
+            self.base_path, {self.base_path}
+        )
 
         logger.info(f"MemoryToolExecutor initialized at {self.base_path}")
 
-    def execute(
+    async def execute(
         self,
         tool_input: Dict[str, Any],
         current_server_id: Optional[str] = None,
@@ -81,13 +194,13 @@ class MemoryToolExecutor:
 
         try:
             if command == "view":
-                return self._view(tool_input)
+                return await self._view(tool_input)
             elif command == "create":
-                return self._create(tool_input)
+                return await self._create(tool_input)
             elif command == "str_replace":
-                return self._str_replace(tool_input)
+                return await self._str_replace(tool_input)
             elif command == "insert":
-                return self._insert(tool_input)
+                return await self._insert(tool_input)
             elif command == "delete":
                 return self._delete(tool_input)
             elif command == "rename":
@@ -100,38 +213,34 @@ class MemoryToolExecutor:
             return f"Error: {str(e)}"
 
     def _validate_path(self, path: str) -> bool:
-        """Validate path is within /memories/{bot_id}/ boundary"""
+        """
+        Validate path is within /memories/{bot_id}/ boundary.
+
+        The prefix regex is only a cheap reject-first gate: every accepted
+        path is still resolve()d, so a symlink inside the memory tree can't
+        lead outside it.
+        """
         # Allow root memories directory
         if path == "/memories":
             return True
 
         # Allow bot's directory and subdirectories
-        bot_prefix = f"/memories/{self.bot_id}"
-        if path == bot_prefix or path.startswith(f"{bot_prefix}/"):
-            pass  # Valid
-        else:
-            logger.warning(f"Invalid memory path (must be /memories or under {bot_prefix}): {path}")
+        if not self._path_re.match(path):
+            logger.warning(f"Invalid memory path (must be /memories or under {self._bot_prefix}): {path}")
             return False
 
-        # Check for directory traversal
-        if path == "/memories":
-            return True
-
-        if path == bot_prefix:
-            relative_path = ""  # Root of bot's directory
-        else:
-            relative_path = path.replace(f"{bot_prefix}/", "")
+        # Check for directory traversal (the regex guarantees the prefix,
+        # so slicing strips it)
+        relative_path = path[self._bot_prefix_len:]  # "" at the bot root
 
         try:
             if relative_path:
                 file_path = (self.base_path / relative_path).resolve()
             else:
-                file_path = self.base_path.resolve()
-
-            base_resolved = self.base_path.resolve()
+                file_path = self._base_resolved
 
             # Ensure file_path is within base_path
-            file_path.relative_to(base_resolved)
+            file_path.relative_to(self._base_resolved)
             return True
 
         except ValueError:
@@ -139,37 +248,58 @@ class MemoryToolExecutor:
             return False
 
     def _path_to_filesystem(self, memory_path: str) -> Path:
-        """Convert memory tool path to filesystem path"""
-        bot_prefix = f"/memories/{self.bot_id}"
-
+        """Convert memory tool path to filesystem path (already validated)"""
         if memory_path == "/memories":
             return self.base_path.parent  # Up one level from bot directory
 
-        if memory_path == bot_prefix:
+        if memory_path == self._bot_prefix:
             return self.base_path
 
-        relative_path = memory_path.replace(f"{bot_prefix}/", "")
-        return self.base_path / relative_path
-
-    def _view(self, tool_input: Dict[str, Any]) -> str:
+        fs_path = self._fs_path_cache.get(memory_path)
+        if fs_path is None:
+            if len(self._fs_path_cache) >= _FS_PATH_CACHE_MAX:
+                self._fs_path_cache.clear()
+            relative_path = memory_path[self._bot_prefix_len:]
+            fs_path = self._fs_path_cache[memory_path] = self.base_path / relative_path
+        return fs_path
+
+    def _ensure_dir(self, path: Path) -> None:
+        """mkdir -p, memoized per directory."""
+        if path in self._known_dirs:
+            return
+        path.mkdir(parents=True, exist_ok=True)
+        self._known_dirs.add(path)
+
+    def _forget_dirs(self, fs_path: Path) -> None:
+        """Drop memoized directories at or under fs_path."""
+        self._known_dirs.difference_update([
+            d for d in self._known_dirs
+            if d == fs_path or fs_path in d.parents
+        ])
+
+    async def _view(self, tool_input: Dict[str, Any]) -> str:
         """View directory contents or file contents with optional line range"""
         path = tool_input["path"]
         view_range = tool_input.get("view_range")
 
         fs_path = self._path_to_filesystem(path)
 
-        if not fs_path.exists():
+        # One stat for both the existence and the file-vs-directory check
+        try:
+            st = os.stat(fs_path)
+        except FileNotFoundError:
             return f"Path does not exist: {path}"
 
-        if fs_path.is_dir():
+        if stat.S_ISDIR(st.st_mode):
             # List directory contents
             try:
-                items = []
-                for item in sorted(fs_path.iterdir()):
-                    if item.is_dir():
-                        items.append(f"{item.name}/")
-                    else:
-                        items.append(item.name)
+                # DirEntry.is_dir() answers from the readdir d_type, so no
+                # per-entry stat like Path.is_dir()
+                with os.scandir(fs_path) as it:
+                    items = [
+                        f"{entry.name}/" if entry.is_dir() else entry.name
+                        for entry in sorted(it, key=lambda e: e.name)
+                    ]
 
                 if not items:
                     return f"Directory is empty: {path}"
@@ -180,26 +310,27 @@ class MemoryToolExecutor:
                 return f"Error listing directory: {str(e)}"
 
         # View file
-        try:
-            with open(fs_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+        if st.st_size == 0:
+            return f"File exists but is empty: {path}"
 
-            if not content:
-                return f"File exists but is empty: {path}"
-
-            # Apply line range if specified (1-indexed)
+        try:
             if view_range:
-                lines = content.splitlines()
+                # Apply line range (1-indexed) while streaming - stops
+                # reading at the last requested line
                 start, end = view_range
-                content = "\n".join(lines[start-1:end])
+                content = await asyncio.to_thread(_read_line_range, fs_path, start, end)
+            elif st.st_size >= _UNCACHED_VIEW_MIN_BYTES:
+                content = await asyncio.to_thread(_read_text_uncached, fs_path)
+            else:
+                content = await asyncio.to_thread(_read_text, fs_path)
 
-            logger.debug(f"Viewed memory file: {path} ({len(content)} chars)")
+            logger.debug("Viewed memory file: %s (%d chars)", path, len(content))
             return content
 
         except Exception as e:
             return f"Error reading file: {str(e)}"
 
-    def _create(self, tool_input: Dict[str, Any]) -> str:
+    async def _create(self, tool_input: Dict[str, Any]) -> str:
         """Create or overwrite file"""
         path = tool_input["path"]
         file_text = tool_input.get("file_text", "")
@@ -207,18 +338,25 @@ class MemoryToolExecutor:
         fs_path = self._path_to_filesystem(path)
 
         try:
-            fs_path.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(fs_path.parent)
 
-            with open(fs_path, 'w', encoding='utf-8') as f:
-                f.write(file_text)
-
-            logger.info(f"Created memory file: {path} ({len(file_text)} chars)")
+            # open, write and close in one executor hop (aiofiles would
+            # dispatch each separately)
+            try:
+                await asyncio.to_thread(_write_text, fs_path, file_text)
+            except FileNotFoundError:
+                # Parent removed outside this executor - recreate and retry
+                self._known_dirs.discard(fs_path.parent)
+                self._ensure_dir(fs_path.parent)
+                await asyncio.to_thread(_write_text, fs_path, file_text)
+
+            logger.info("Created memory file: %s (%d chars)", path, len(file_text))
             return f"Successfully created {path}"
 
         except Exception as e:
             return f"Error creating file: {str(e)}"
 
-    def _str_replace(self, tool_input: Dict[str, Any]) -> str:
+    async def _str_replace(self, tool_input: Dict[str, Any]) -> str:
         """Replace first occurrence of text in existing file"""
         path = tool_input["path"]
         old_str = tool_input.get("old_str", "")
@@ -226,12 +364,25 @@ class MemoryToolExecutor:
 
         fs_path = self._path_to_filesystem(path)
 
-        if not fs_path.exists():
-            return f"Error: File does not exist at {path}. Use create to make a new file."
-
         try:
-            with open(fs_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            try:
+                spliced = await asyncio.to_thread(
+                    _splice_file, fs_path, old_str.encode('utf-8'), new_str.encode('utf-8')
+                )
+            except FileNotFoundError:
+                return f"Error: File does not exist at {path}. Use create to make a new file."
+
+            if spliced:
+                logger.info("Updated memory file: %s", path)
+                return f"Successfully updated {path}"
+
+            # Small file, no byte match, or no in-place growth on this
+            # platform: a text-mode pass, whose newline translation still
+            # matches CRLF files
+            try:
+                content = await asyncio.to_thread(_read_text, fs_path)
+            except FileNotFoundError:
+                return f"Error: File does not exist at {path}. Use create to make a new file."
 
             if old_str not in content:
                 return f"Error: String not found in file."
@@ -239,16 +390,15 @@ class MemoryToolExecutor:
             # Replace only first occurrence
             new_content = content.replace(old_str, new_str, 1)
 
-            with open(fs_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+            await asyncio.to_thread(_write_text, fs_path, new_content)
 
-            logger.info(f"Updated memory file: {path}")
+            logger.info("Updated memory file: %s", path)
             return f"Successfully updated {path}"
 
         except Exception as e:
             return f"Error updating file: {str(e)}"
 
-    def _insert(self, tool_input: Dict[str, Any]) -> str:
+    async def _insert(self, tool_input: Dict[str, Any]) -> str:
         """Insert text at specific line number (1-indexed)"""
         path = tool_input["path"]
         insert_line = tool_input.get("insert_line")
@@ -259,20 +409,14 @@ class MemoryToolExecutor:
 
         fs_path = self._path_to_filesystem(path)
 
-        if not fs_path.exists():
-            return f"Error: File does not exist at {path}. Use create to make a new file."
-
         try:
-            with open(fs_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-
-            # Insert before specified line (convert from 1-indexed to 0-indexed)
-            lines.insert(insert_line - 1, new_str + "\n")
-
-            with open(fs_path, 'w', encoding='utf-8') as f:
-                f.writelines(lines)
+            try:
+                # Insert before specified line (convert from 1-indexed to 0-indexed)
+                await asyncio.to_thread(_insert_line, fs_path, insert_line - 1, new_str)
+            except FileNotFoundError:
+                return f"Error: File does not exist at {path}. Use create to make a new file."
 
-            logger.info(f"Inserted into memory file: {path} at line {insert_line}")
+            logger.info("Inserted into memory file: %s at line %s", path, insert_line)
             return f"Successfully inserted text at line {insert_line} in {path}"
 
         except Exception as e:
@@ -283,17 +427,20 @@ class MemoryToolExecutor:
         path = tool_input["path"]
         fs_path = self._path_to_filesystem(path)
 
-        if not fs_path.exists():
-            return f"Error: Path does not exist: {path}"
-
         try:
-            if fs_path.is_dir():
+            try:
+                st = os.stat(fs_path)
+            except FileNotFoundError:
+                return f"Error: Path does not exist: {path}"
+
+            if stat.S_ISDIR(st.st_mode):
                 shutil.rmtree(fs_path)
-                logger.info(f"Deleted memory directory: {path}")
+                self._forget_dirs(fs_path)
+                logger.info("Deleted memory directory: %s", path)
                 return f"Successfully deleted directory {path}"
             else:
                 fs_path.unlink()
-                logger.info(f"Deleted memory file: {path}")
+                logger.info("Deleted memory file: %s", path)
                 return f"Successfully deleted {path}"
 
         except Exception as e:
@@ -323,10 +470,11 @@ class MemoryToolExecutor:
             return f"Error: Destination already exists: {new_path}"
 
         try:
-            new_fs_path.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(new_fs_path.parent)
             old_fs_path.rename(new_fs_path)
+            self._forget_dirs(old_fs_path)
 
-            logger.info(f"Renamed memory path: {old_path} -> {new_path}")
+            logger.info("Renamed memory path: %s -> %s", old_path, new_path)
             return f"Successfully renamed {old_path} to {new_path}"
 
         except Exception as e:
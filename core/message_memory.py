@@ -6,21 +6,115 @@ Handles Discord message storage, updates, and retrieval.
 """
 
 import aiosqlite
+import asyncio
+import contextlib
 import sqlite3
 import discord
 import json
 import logging
 from pathlib import Path
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional, Dict
+from typing import AsyncIterator, List, Optional, Dict
 from dataclasses import dataclass
 
+from .internal_constants import (
+    CLEANUP_BATCH_SIZE,
+    DEFERRED_COMMIT_DELAY_S,
+    DEFERRED_COMMIT_MAX_OPS,
+    FTS_MERGE_PAGES,
+    READER_POOL_SIZE,
+)
+
 logger = logging.getLogger(__name__)
 
+# Insert-or-refresh: an existing row is only rewritten (and its FTS row
+# touched) when the content or attachment flag actually changed.
+_UPSERT_MESSAGE_SQL = """
+    INSERT INTO messages (
+        message_id, channel_id, guild_id,
+        author_id, author_name, content,
+        timestamp, is_bot, has_attachments
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(message_id) DO UPDATE SET
+        content = excluded.content,
+        has_attachments = excluded.has_attachments,
+        author_name = excluded.author_name
+    WHERE messages.content IS NOT excluded.content
+       OR messages.has_attachments IS NOT excluded.has_attachments
+"""
+
+_INSERT_MENTION_SQL = "INSERT OR IGNORE INTO message_mentions (message_id, user_id) VALUES (?, ?)"
+
+# messages.timestamp is stored as integer microseconds since the Unix epoch
+# (UTC): compact, compared numerically, no ISO parse per row on read.
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_EPOCH_NAIVE = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_micros(dt: datetime) -> int:
+    """Epoch microseconds for a datetime; naive values are taken as UTC."""
+    if dt.tzinfo is None:
+        return (dt - _EPOCH_NAIVE) // _MICROSECOND
+    return (dt - _EPOCH) // _MICROSECOND
+
+
+def _from_micros(us: int) -> datetime:
+    """Naive UTC datetime for stored epoch microseconds."""
+    return _EPOCH_NAIVE + timedelta(microseconds=us)
+
+
+# StoredMessage columns in the order _row_to_message unpacks them
+_MESSAGE_FIELDS = (
+    "message_id", "channel_id", "guild_id", "author_id", "author_name",
+    "content", "timestamp", "is_bot", "is_system", "has_attachments",
+)
+
+
+def _message_columns(table: str) -> str:
+    """_MESSAGE_FIELDS plus the message's mentioned user ids, comma-joined."""
+    fields = ", ".join(f"{table}.{name}" for name in _MESSAGE_FIELDS)
+    return (
+        f"{fields}, (SELECT group_concat(mm.user_id) FROM message_mentions mm"
+        f" WHERE mm.message_id = {table}.message_id) AS mention_ids"
+    )
+
+
+# Projections for every StoredMessage read (see _row_to_message)
+_MESSAGE_COLUMNS = _message_columns("messages")
+_MESSAGE_COLUMNS_M = _message_columns("m")  # search's "messages m" alias
+
+# Hot-path statements, built once so every call passes the identical text
+# and hits sqlite3's per-connection prepared-statement cache
+_INSERT_MESSAGE_SQL = """
+    INSERT INTO messages (
+        message_id, channel_id, guild_id,
+        author_id, author_name, content,
+        timestamp, is_bot, has_attachments
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(message_id) DO NOTHING
+"""
+
+# Newest N, handed back oldest-first: the outer sort runs over just the
+# LIMIT rows, so callers get chronological order without a Python reverse
+_GET_RECENT_SQL = f"""
+    SELECT * FROM (
+        SELECT {_MESSAGE_COLUMNS} FROM messages
+        WHERE channel_id = ?
+        ORDER BY timestamp DESC
+        LIMIT ?
+    ) ORDER BY timestamp ASC
+"""
+
+# sqlite3 keeps 128 prepared statements per connection by default; the
+# variable-length NOT IN / search / paging queries would otherwise evict
+# the hot ones
+_STATEMENT_CACHE_SIZE = 512
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StoredMessage:
-    """Message representation in storage"""
+    """Message representation in storage (immutable, no per-instance __dict__)"""
     message_id: str
     channel_id: str
     guild_id: str
@@ -50,22 +144,29 @@ class MessageMemory:
         author_id TEXT NOT NULL,
         author_name TEXT NOT NULL,
         content TEXT,
-        timestamp DATETIME NOT NULL,
+        timestamp INTEGER NOT NULL,  -- epoch microseconds, UTC
         is_bot BOOLEAN NOT NULL,
         is_system BOOLEAN NOT NULL DEFAULT 0,
         has_attachments BOOLEAN NOT NULL,
-        mentions TEXT,
         created_at DATETIME DEFAULT CURRENT_TIMESTAMP
     );
 
-    CREATE INDEX IF NOT EXISTS idx_channel_timestamp
-    ON messages(channel_id, timestamp DESC);
+    -- author_id rides along so get_channel_stats is index-only
+    CREATE INDEX IF NOT EXISTS idx_channel_ts_author
+    ON messages(channel_id, timestamp DESC, author_id);
 
-    CREATE INDEX IF NOT EXISTS idx_guild
-    ON messages(guild_id);
+    -- Covers get_users_in_server outright (DISTINCT + ORDER BY off the
+    -- index, no table lookups) and every other guild_id filter as a prefix
+    CREATE INDEX IF NOT EXISTS idx_guild_author
+    ON messages(guild_id, author_id);
 
-    CREATE INDEX IF NOT EXISTS idx_author
-    ON messages(author_id);
+    -- Channel-independent time ranges: cleanup_old's prefix delete and
+    -- the supervisor's per-day counts
+    CREATE INDEX IF NOT EXISTS idx_timestamp
+    ON messages(timestamp);
+
+    CREATE INDEX IF NOT EXISTS idx_author_timestamp
+    ON messages(author_id, timestamp DESC);
 
     CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5(
         message_id UNINDEXED,
@@ -89,6 +190,35 @@ class MessageMemory:
         WHERE rowid = old.id;
     END;
 
+    -- Mentioned user ids, one row per (message, user): indexable by user,
+    -- no JSON encode/decode per message. Snowflakes fit a 64-bit INTEGER.
+    CREATE TABLE IF NOT EXISTS message_mentions (
+        message_id TEXT NOT NULL,
+        user_id    INTEGER NOT NULL,
+        PRIMARY KEY (message_id, user_id)
+    ) WITHOUT ROWID;
+
+    CREATE INDEX IF NOT EXISTS idx_mentions_user
+    ON message_mentions(user_id);
+
+    CREATE TRIGGER IF NOT EXISTS messages_mentions_ad AFTER DELETE ON messages BEGIN
+        DELETE FROM message_mentions WHERE message_id = old.message_id;
+    END;
+
+    -- One row per guild with stored messages: added by trigger, pruned by
+    -- cleanup_old. get_active_servers reads this instead of a DISTINCT
+    -- over every message
+    CREATE TABLE IF NOT EXISTS guilds (
+        guild_id  TEXT PRIMARY KEY,
+        last_seen INTEGER NOT NULL  -- epoch microseconds of newest message
+    );
+
+    CREATE TRIGGER IF NOT EXISTS messages_guild_ai AFTER INSERT ON messages BEGIN
+        INSERT INTO guilds (guild_id, last_seen) VALUES (new.guild_id, new.timestamp)
+        ON CONFLICT(guild_id) DO UPDATE SET last_seen = excluded.last_seen
+        WHERE excluded.last_seen > guilds.last_seen;
+    END;
+
     CREATE TABLE IF NOT EXISTS episode_watermarks (
         channel_id TEXT PRIMARY KEY,
         last_episodized_message_id TEXT,
@@ -132,14 +262,43 @@ class MessageMemory:
         self._threads_by_parent: dict = {}
         self._thread_meta: dict = {}  # tid -> (parent, name, archived); upsert no-op guard
         self._channel_name_cache: dict = {}  # id -> (name, kind, guild_id); no-op guard (v0.9)
+        # Serializes multi-statement write paths: a commit from another
+        # coroutine can't land between an insert and its mention rows
+        self._write_lock = asyncio.Lock()
+        # Live writes awaiting a group commit (see _commit_deferred)
+        self._deferred_ops = 0
+        self._deferred_commit_task: Optional[asyncio.Task] = None
+        # Read-only connections for tool queries (see _reader)
+        self._readers: Optional[asyncio.Queue] = None
+        self._reader_conns: List[aiosqlite.Connection] = []
 
     async def initialize(self):
         """Initialize database connection and create tables"""
-        self._db = await aiosqlite.connect(str(self.db_path), timeout=30.0)
+        self._db = await aiosqlite.connect(
+            str(self.db_path), timeout=30.0, cached_statements=_STATEMENT_CACHE_SIZE
+        )
         self._db.row_factory = aiosqlite.Row
 
-        # Enable WAL mode for better concurrent access (fixes database locked errors)
+        # Enable WAL mode for better concurrent access (fixes database locked errors).
+        # WAL keeps -wal/-shm sidecar files next to db_path: the directory must
+        # be writable and local (no network shares), and backups need all three.
+        # Busy waits come from connect(timeout=30.0), i.e. busy_timeout=30000.
         await self._db.execute("PRAGMA journal_mode=WAL;")
+        # Under WAL, NORMAL only fsyncs at checkpoints - a power cut can lose
+        # the last few commits but never corrupts, and every message is a
+        # commit. The rest trade a little RAM for fewer page reads.
+        await self._db.execute("PRAGMA synchronous=NORMAL;")
+        await self._db.execute("PRAGMA temp_store=MEMORY;")
+        await self._db.execute("PRAGMA cache_size=-64000;")  # KiB, ~64 MB
+        await self._db.execute("PRAGMA mmap_size=268435456;")  # 256 MB
+        # ANALYZE samples ~400 rows per index instead of reading every page
+        await self._db.execute("PRAGMA analysis_limit=400;")
+
+        # A bulk load that never reached rebuild_fts_index leaves the FTS
+        # triggers dropped; SCHEMA recreates them, the index needs a rebuild
+        cursor = await self._db.execute(
+            "SELECT name FROM sqlite_master WHERE name IN ('messages', 'messages_ai')")
+        fts_stale = {row[0] for row in await cursor.fetchall()} == {"messages"}
 
         await self._db.executescript(self.SCHEMA)
         await self._db.commit()
@@ -147,6 +306,10 @@ class MessageMemory:
         # Run migrations for existing databases
         await self._run_migrations()
 
+        if fts_stale:
+            logger.warning("FTS triggers were missing (interrupted bulk load), rebuilding index")
+            await self.rebuild_fts_index()
+
         # Hydrate thread->parent sync caches
         self._thread_parents = {}
         self._threads_by_parent = {}
@@ -164,8 +327,52 @@ class MessageMemory:
         for row in await cursor.fetchall():
             self._channel_name_cache[row["id"]] = (row["name"], row["kind"], row["guild_id"])
 
+        await self._open_readers()
+
         logger.info(f"Message memory initialized: {self.db_path}")
 
+    async def _open_readers(self):
+        """Open the read-only pool; on failure tool queries use _db."""
+        try:
+            readers: asyncio.Queue = asyncio.Queue()
+            for _ in range(READER_POOL_SIZE):
+                conn = await aiosqlite.connect(
+                    f"file:{self.db_path.as_posix()}?mode=ro", uri=True,
+                    timeout=30.0, cached_statements=_STATEMENT_CACHE_SIZE,
+                )
+                conn.row_factory = aiosqlite.Row
+                self._reader_conns.append(conn)
+                await conn.execute("PRAGMA mmap_size=268435456;")
+                readers.put_nowait(conn)
+            self._readers = readers
+        except Exception as e:
+            logger.warning(f"Read-only connections unavailable, sharing the writer: {e}")
+            for conn in self._reader_conns:
+                await conn.close()
+            self._reader_conns = []
+
+    @contextlib.asynccontextmanager
+    async def _reader(self):
+        """
+        Borrow a read-only connection for a tool query.
+
+        Long FTS searches and stats scans then run on their own worker
+        thread instead of queueing live message writes behind them. Pending
+        group-committed writes are flushed first, so the reader sees the
+        same rows _db would (deleted messages never resurface).
+        """
+        if self._readers is None:
+            yield self._db
+            return
+        if self._deferred_ops:
+            async with self._write_lock:
+                await self._flush_deferred()
+        conn = await self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put_nowait(conn)
+
     async def _run_migrations(self):
         """Run database migrations for schema updates"""
         if not self._db:
@@ -188,12 +395,177 @@ class MessageMemory:
         except Exception as e:
             logger.error(f"Error running migrations: {e}", exc_info=True)
 
+        # Migration: JSON mentions column -> message_mentions rows
+        try:
+            cursor = await self._db.execute("PRAGMA table_info(messages)")
+            if "mentions" in [col[1] for col in await cursor.fetchall()]:
+                logger.info("Running migration: Moving mentions into message_mentions")
+                await self._db.execute(
+                    """
+                    INSERT OR IGNORE INTO message_mentions (message_id, user_id)
+                    SELECT m.message_id, j.value
+                    FROM messages m, json_each(m.mentions) j
+                    WHERE m.mentions IS NOT NULL AND m.mentions != '[]'
+                    """
+                )
+                try:
+                    await self._db.execute("ALTER TABLE messages DROP COLUMN mentions")
+                except sqlite3.OperationalError:
+                    # SQLite < 3.35: no DROP COLUMN - empty it so reruns are no-ops
+                    await self._db.execute("UPDATE messages SET mentions = NULL")
+                await self._db.commit()
+                logger.info("Migration complete: mentions moved to message_mentions")
+        except Exception as e:
+            logger.error(f"Error migrating mentions: {e}", exc_info=True)
+
+        # Migration: message_mentions.user_id TEXT -> INTEGER (8-byte snowflakes)
+        try:
+            cursor = await self._db.execute("PRAGMA table_info(message_mentions)")
+            column_types = {col[1]: col[2] for col in await cursor.fetchall()}
+            if column_types.get("user_id", "").upper() == "TEXT":
+                logger.info("Running migration: Rebuilding message_mentions with INTEGER user ids")
+                await self._db.execute("DROP TRIGGER IF EXISTS messages_mentions_ad")
+                await self._db.execute(
+                    """
+                    CREATE TABLE message_mentions_new (
+                        message_id TEXT NOT NULL,
+                        user_id    INTEGER NOT NULL,
+                        PRIMARY KEY (message_id, user_id)
+                    ) WITHOUT ROWID
+                    """
+                )
+                await self._db.execute(
+                    """
+                    INSERT OR IGNORE INTO message_mentions_new (message_id, user_id)
+                    SELECT message_id, CAST(user_id AS INTEGER) FROM message_mentions
+                    """
+                )
+                await self._db.execute("DROP TABLE message_mentions")
+                await self._db.execute("ALTER TABLE message_mentions_new RENAME TO message_mentions")
+                # Index and delete trigger come back from SCHEMA
+                await self._db.executescript(self.SCHEMA)
+                await self._db.commit()
+                logger.info("Migration complete: message_mentions user ids are INTEGER")
+        except Exception as e:
+            logger.error(f"Error migrating message_mentions: {e}", exc_info=True)
+
+        # Migration: idx_author(author_id) is a prefix of idx_author_timestamp,
+        # idx_guild(guild_id) of idx_guild_author, idx_channel_timestamp of
+        # idx_channel_ts_author
+        try:
+            await self._db.execute("DROP INDEX IF EXISTS idx_author")
+            await self._db.execute("DROP INDEX IF EXISTS idx_guild")
+            await self._db.execute("DROP INDEX IF EXISTS idx_channel_timestamp")
+            await self._db.commit()
+        except Exception as e:
+            logger.error(f"Error dropping superseded indexes: {e}", exc_info=True)
+
+        # Migration: ISO-8601 text timestamps -> integer epoch microseconds
+        try:
+            await self._migrate_text_timestamps()
+        except Exception as e:
+            logger.error(f"Error migrating timestamps: {e}", exc_info=True)
+
+        # Migration: seed the guilds table from pre-trigger history
+        try:
+            cursor = await self._db.execute("SELECT 1 FROM guilds LIMIT 1")
+            if await cursor.fetchone() is None:
+                await self._db.execute(
+                    """
+                    INSERT OR IGNORE INTO guilds (guild_id, last_seen)
+                    SELECT guild_id, MAX(timestamp) FROM messages GROUP BY guild_id
+                    """
+                )
+                await self._db.commit()
+        except Exception as e:
+            logger.error(f"Error seeding guilds table: {e}", exc_info=True)
+
+    async def _migrate_text_timestamps(self, chunk_size: int = 5000):
+        """Rewrite any TEXT timestamps as epoch microseconds, in id order."""
+        cursor = await self._db.execute(
+            "SELECT 1 FROM messages WHERE typeof(timestamp) = 'text' LIMIT 1")
+        if await cursor.fetchone() is None:
+            return
+
+        logger.info("Running migration: Converting message timestamps to epoch microseconds")
+        # Content is untouched - skip the per-row FTS rewrite; the trigger
+        # is recreated from SCHEMA below
+        await self._db.execute("DROP TRIGGER IF EXISTS messages_au")
+        converted = skipped = 0
+        last_id = 0
+        while True:
+            cursor = await self._db.execute(
+                """
+                SELECT id, timestamp FROM messages
+                WHERE id > ? AND typeof(timestamp) = 'text'
+                ORDER BY id LIMIT ?
+                """,
+                (last_id, chunk_size),
+            )
+            rows = await cursor.fetchall()
+            if not rows:
+                break
+            last_id = rows[-1][0]
+            updates = []
+            for row_id, ts in rows:
+                try:
+                    updates.append((_to_micros(datetime.fromisoformat(ts)), row_id))
+                except ValueError:
+                    skipped += 1
+            await self._db.executemany(
+                "UPDATE messages SET timestamp = ? WHERE id = ?", updates)
+            converted += len(updates)
+        await self._db.executescript(self.SCHEMA)
+        await self._db.commit()
+        if skipped:
+            logger.warning(f"Timestamp migration skipped {skipped} unparseable rows")
+        logger.info(f"Migration complete: {converted} timestamps converted")
+
     async def close(self):
         """Close database connection"""
+        for conn in self._reader_conns:
+            await conn.close()
+        self._reader_conns = []
+        self._readers = None
         if self._db:
+            if self._deferred_commit_task:
+                self._deferred_commit_task.cancel()
+                self._deferred_commit_task = None
+            try:
+                await self.optimize()
+            except Exception as e:
+                logger.warning(f"PRAGMA optimize on close failed: {e}")
+                async with self._write_lock:
+                    await self._flush_deferred()
             await self._db.close()
             logger.info("Message memory closed")
 
+    async def optimize(self, analyze: bool = False):
+        """
+        Refresh query-planner statistics (sqlite_stat1) and compact FTS.
+
+        PRAGMA optimize only re-analyzes tables whose statistics look stale
+        (mostly growth), and a bounded FTS 'merge' folds small index
+        segments together. analyze=True - used after bulk deletes, which
+        optimize doesn't count as staleness - forces ANALYZE messages and a
+        full FTS 'optimize', which also drops the deleted rows' entries.
+        """
+        if not self._db:
+            raise RuntimeError("MessageMemory not initialized. Call initialize() first.")
+
+        async with self._write_lock:
+            await self._flush_deferred()
+            if analyze:
+                await self._db.execute("ANALYZE messages")
+                await self._db.execute(
+                    "INSERT INTO messages_fts(messages_fts) VALUES('optimize')")
+            else:
+                await self._db.execute(
+                    "INSERT INTO messages_fts(messages_fts, rank) VALUES('merge', ?)",
+                    (FTS_MERGE_PAGES,))
+            await self._db.execute("PRAGMA optimize")
+            await self._db.commit()
+
     # ------------------------------------------------------------------
     # Channel names (v0.9): offline name source for the supervisor UI.
     # ------------------------------------------------------------------
@@ -274,20 +646,9 @@ class MessageMemory:
         d["payload"] = json.loads(d["payload"])
         return d
 
-    async def add_message(self, message: discord.Message):
-        """
-        Store Discord message in database.
-
-        Handles forwarded messages and embeds.
-        Updates content if message already exists (UPSERT pattern).
-        """
-        if not self._db:
-            raise RuntimeError("MessageMemory not initialized. Call initialize() first.")
-
-        mentions = [str(user.id) for user in message.mentions]
-        mentions_json = json.dumps(mentions)
-
-        # Extract content from message and embeds
+    @staticmethod
+    def _extract_content(message: discord.Message) -> str:
+        """Flatten message text, forward marker and embed text into one string."""
         content_parts = []
         if message.content:
             content_parts.append(message.content)
@@ -300,20 +661,15 @@ class MessageMemory:
                 if ref_type == MessageReferenceType.forward:
                     # Discord doesn't provide forwarded content via API
                     content_parts.append("[Forwarded message - content not accessible]")
-                    logger.debug(f"Message {message.id} is a forwarded message")
+                    logger.debug("Message %s is a forwarded message", message.id)
 
         # Extract embed content
         if message.embeds:
-            logger.info(f"[EMBED] Message {message.id} has {len(message.embeds)} embeds")
+            logger.debug("[EMBED] Message %s has %d embeds", message.id, len(message.embeds))
             for idx, embed in enumerate(message.embeds):
-                has_title = bool(embed.title)
-                has_desc = bool(embed.description)
-                logger.info(f"  [EMBED] Embed {idx}: type={embed.type}, title={has_title}, desc={has_desc}, fields={len(embed.fields)}")
-
-                if has_title:
-                    logger.info(f"    Title: {embed.title[:100]}")
-                if has_desc:
-                    logger.info(f"    Description: {embed.description[:100]}")
+                logger.debug("  [EMBED] Embed %d: type=%s, title=%s, desc=%s, fields=%d",
+                             idx, embed.type, bool(embed.title), bool(embed.description),
+                             len(embed.fields))
 
                 if embed.description:
                     content_parts.append(embed.description)
@@ -325,67 +681,153 @@ class MessageMemory:
 
         full_content = "\n".join(content_parts)
         if message.embeds and not message.content:
-            logger.info(f"[EMBED] Message {message.id} is embed-only, extracted content length: {len(full_content)}")
+            logger.debug("[EMBED] Message %s is embed-only, extracted content length: %d",
+                         message.id, len(full_content))
         elif not message.content and not content_parts:
-            logger.warning(f"[EMPTY] Message {message.id} has NO content (no text, no embeds with content)")
+            logger.warning("[EMPTY] Message %s has NO content (no text, no embeds with content)", message.id)
+        return full_content
 
-        try:
-            await self._db.execute(
+    @staticmethod
+    def _message_row(message: discord.Message, full_content: str) -> tuple:
+        """Insert parameters for one message, in _UPSERT_MESSAGE_SQL column order."""
+        return (
+            str(message.id),
+            str(message.channel.id),
+            str(message.guild.id) if message.guild else "DM",
+            str(message.author.id),
+            message.author.display_name,
+            full_content,
+            _to_micros(message.created_at),
+            message.author.bot,
+            len(message.attachments) > 0,
+        )
+
+    @staticmethod
+    def _mention_rows(message: discord.Message) -> List[tuple]:
+        """(message_id, user_id) rows for message_mentions."""
+        message_id = str(message.id)
+        return [(message_id, user.id) for user in message.mentions]
+
+    async def _replace_mentions(self, message: discord.Message) -> None:
+        """Rewrite a message's mention rows (caller commits)."""
+        await self._db.execute(
+            "DELETE FROM message_mentions WHERE message_id = ?", (str(message.id),))
+        mention_rows = self._mention_rows(message)
+        if mention_rows:
+            await self._db.executemany(_INSERT_MENTION_SQL, mention_rows)
+
+    async def add_messages(self, messages: List[discord.Message]) -> int:
+        """
+        Store a batch of messages in one transaction (backfill path).
+
+        Same upsert semantics as add_message - an existing row is only
+        rewritten when its content changed - but one executemany and one
+        commit for the whole batch instead of one per message.
+
+        Returns:
+            Rows inserted or updated
+        """
+        if not self._db:
+            raise RuntimeError("MessageMemory not initialized. Call initialize() first.")
+        if not messages:
+            return 0
+
+        rows = [self._message_row(m, self._extract_content(m)) for m in messages]
+        mention_rows = [r for m in messages for r in self._mention_rows(m)]
+        async with self._write_lock:
+            cursor = await self._db.executemany(_UPSERT_MESSAGE_SQL, rows)
+            changed = cursor.rowcount
+            # Mentions are refreshed for the whole batch in the same transaction
+            await self._db.executemany(
+                "DELETE FROM message_mentions WHERE message_id = ?",
+                [(row[0],) for row in rows],
+            )
+            if mention_rows:
+                await self._db.executemany(_INSERT_MENTION_SQL, mention_rows)
+            await self._db.commit()
+            self._deferred_ops = 0  # the commit above covered them
+        logger.debug("Stored batch of %d messages (%d changed)", len(rows), changed)
+        return changed
+
+    async def suspend_fts_triggers(self):
+        """
+        Drop the per-row FTS sync triggers ahead of a bulk load.
+
+        Every insert otherwise re-tokenizes into messages_fts one row at a
+        time; rebuild_fts_index() indexes the whole table in one pass and
+        restores the triggers. Writes in between are unsearchable until then.
+        """
+        if not self._db:
+            raise RuntimeError("MessageMemory not initialized. Call initialize() first.")
+
+        async with self._write_lock:
+            await self._flush_deferred()
+            for trigger in ("messages_ai", "messages_ad", "messages_au"):
+                await self._db.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+            await self._db.commit()
+        logger.info("FTS triggers suspended for bulk load")
+
+    async def rebuild_fts_index(self):
+        """Reindex messages_fts from messages and recreate its triggers."""
+        if not self._db:
+            raise RuntimeError("MessageMemory not initialized. Call initialize() first.")
+
+        async with self._write_lock:
+            await self._flush_deferred()
+            await self._db.execute("INSERT INTO messages_fts(messages_fts) VALUES('rebuild')")
+            await self._db.executescript(self.SCHEMA)
+            await self._db.commit()
+        logger.info("FTS index rebuilt")
+
+    async def add_message(self, message: discord.Message):
+        """
+        Store Discord message in database.
+
+        Handles forwarded messages and embeds.
+        Updates content if message already exists (UPSERT pattern).
+        """
+        if not self._db:
+            raise RuntimeError("MessageMemory not initialized. Call initialize() first.")
+
+        full_content = self._extract_content(message)
+
+        async with self._write_lock:
+            # Live messages are new: one plain insert, no conflict handling
+            cursor = await self._db.execute(
+                _INSERT_MESSAGE_SQL,
+                self._message_row(message, full_content),
+            )
+            if cursor.rowcount:
+                mention_rows = self._mention_rows(message)
+                if mention_rows:
+                    await self._db.executemany(_INSERT_MENTION_SQL, mention_rows)
+                await self._commit_deferred()
+                logger.debug("Stored message %s from %s", message.id, message.author.name)
+                return
+
+            # Already stored - rewritten only if content/attachments changed
+            cursor = await self._db.execute(
                 """
-                INSERT INTO messages (
-                    message_id, channel_id, guild_id,
-                    author_id, author_name, content,
-                    timestamp, is_bot, has_attachments, mentions
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                UPDATE messages
+                SET content = ?, has_attachments = ?, author_name = ?
+                WHERE message_id = ?
+                  AND (content IS NOT ? OR has_attachments IS NOT ?)
                 """,
                 (
-                    str(message.id),
-                    str(message.channel.id),
-                    str(message.guild.id) if message.guild else "DM",
-                    str(message.author.id),
+                    full_content,
+                    len(message.attachments) > 0,
                     message.author.display_name,
+                    str(message.id),
                     full_content,
-                    message.created_at.isoformat(),
-                    message.author.bot,
                     len(message.attachments) > 0,
-                    mentions_json,
                 ),
             )
-            await self._db.commit()
-            logger.debug(f"Stored message {message.id} from {message.author.name}")
-
-        except aiosqlite.IntegrityError:
-            # Message exists - check if content changed before updating
-            cursor = await self._db.execute(
-                "SELECT content FROM messages WHERE message_id = ?",
-                (str(message.id),)
-            )
-            row = await cursor.fetchone()
-            existing_content = row[0] if row else None
-
-            # Only update if content actually changed
-            if existing_content != full_content:
-                logger.info(f"[UPSERT] Message {message.id} content CHANGED during backfill")
-                logger.info(f"[UPSERT] OLD: {existing_content[:100]}...")
-                logger.info(f"[UPSERT] NEW: {full_content[:100]}...")
-                await self._db.execute(
-                    """
-                    UPDATE messages
-                    SET content = ?, has_attachments = ?, mentions = ?, author_name = ?
-                    WHERE message_id = ?
-                    """,
-                    (
-                        full_content,
-                        len(message.attachments) > 0,
-                        mentions_json,
-                        message.author.display_name,
-                        str(message.id),
-                    ),
-                )
-                await self._db.commit()
-                logger.info(f"[UPSERT] Successfully updated message {message.id}")
+            if cursor.rowcount:
+                logger.info("[UPSERT] Message %s content CHANGED during backfill", message.id)
+                await self._replace_mentions(message)
+                await self._commit_deferred()
             else:
-                logger.debug(f"Message {message.id} unchanged, skipping update")
+                logger.debug("Message %s unchanged, skipping update", message.id)
 
     async def update_message(self, message: discord.Message):
         """
@@ -397,101 +839,73 @@ class MessageMemory:
         if not self._db:
             raise RuntimeError("MessageMemory not initialized. Call initialize() first.")
 
-        logger.info(f"[EDIT] Updating message {message.id} from {message.author.name}")
-
-        mentions = [str(user.id) for user in message.mentions]
-        mentions_json = json.dumps(mentions)
-
-        # Extract content
-        content_parts = []
-        if message.content:
-            logger.info(f"[EDIT] Original content: {message.content[:200]}")
-            content_parts.append(message.content)
-
-        if message.embeds:
-            logger.info(f"[EMBED UPDATE] Message {message.id}: has {len(message.embeds)} embeds")
-            for idx, embed in enumerate(message.embeds):
-                logger.info(f"  [EMBED UPDATE] Embed {idx}: type={embed.type}, title={bool(embed.title)}, desc={bool(embed.description)}, fields={len(embed.fields)}")
-                if embed.description:
-                    content_parts.append(embed.description)
-                if embed.title:
-                    content_parts.append(embed.title)
-                for field in embed.fields:
-                    if field.value:
-                        content_parts.append(field.value)
-
-        full_content = "\n".join(content_parts)
-        logger.info(f"[EDIT] Full extracted content ({len(full_content)} chars): {full_content[:200]}")
-
-        if message.embeds and not message.content:
-            logger.info(f"[EMBED UPDATE] Message {message.id} is embed-only, extracted content length: {len(full_content)}")
-
-        # Try UPDATE first
-        logger.info(f"[EDIT] Attempting UPDATE for message {message.id}")
-        cursor = await self._db.execute(
-            """
-            UPDATE messages
-            SET content = ?, has_attachments = ?, mentions = ?
-            WHERE message_id = ?
-            """,
-            (
-                full_content,
-                len(message.attachments) > 0,
-                mentions_json,
-                str(message.id),
-            ),
-        )
-
-        rows_updated = cursor.rowcount
-        logger.info(f"[EDIT] UPDATE affected {rows_updated} row(s)")
+        logger.info("[EDIT] Updating message %s from %s", message.id, message.author.name)
 
-        # If no rows updated, INSERT instead (UPSERT pattern)
-        if rows_updated == 0:
-            logger.info(f"[UPSERT] Message {message.id} not in database, inserting (probably older than backfill window)")
+        # Same extraction as add_message, so an edit can't drop the forward
+        # marker or embed text the original insert stored
+        full_content = self._extract_content(message)
+        logger.debug("[EDIT] Extracted content (%d chars): %.200s", len(full_content), full_content)
 
-            try:
-                await self._db.execute(
-                    """
-                    INSERT INTO messages (
-                        message_id, channel_id, guild_id,
-                        author_id, author_name, content,
-                        timestamp, is_bot, has_attachments, mentions
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        str(message.id),
-                        str(message.channel.id),
-                        str(message.guild.id) if message.guild else "DM",
-                        str(message.author.id),
-                        message.author.display_name,
-                        full_content,
-                        message.created_at.isoformat(),
-                        message.author.bot,
-                        len(message.attachments) > 0,
-                        mentions_json,
-                    ),
-                )
-                logger.info(f"[UPSERT] Successfully inserted message {message.id} into database")
-            except aiosqlite.IntegrityError:
-                # Race condition: message inserted between UPDATE and INSERT
-                logger.warning(f"[UPSERT] Message {message.id} already exists (race condition during UPSERT)")
-        else:
-            logger.info(f"[EDIT] Successfully updated existing message {message.id} in database")
+        async with self._write_lock:
+            # One upsert: edits older than the backfill window are inserted
+            cursor = await self._db.execute(
+                _UPSERT_MESSAGE_SQL,
+                self._message_row(message, full_content),
+            )
+            logger.debug("[EDIT] Upsert affected %d row(s) for message %s", cursor.rowcount, message.id)
 
-        await self._db.commit()
-        logger.info(f"[EDIT] Database committed for message {message.id}")
+            await self._replace_mentions(message)
+            await self._commit_deferred()
+            logger.debug("[EDIT] Database write queued for commit for message %s", message.id)
 
     async def delete_message(self, message_id: int):
         """Delete message from storage"""
         if not self._db:
             raise RuntimeError("MessageMemory not initialized. Call initialize() first.")
 
-        await self._db.execute(
-            "DELETE FROM messages WHERE message_id = ?",
-            (str(message_id),)
-        )
-        await self._db.commit()
-        logger.debug(f"Deleted message {message_id}")
+        async with self._write_lock:
+            await self._db.execute(
+                "DELETE FROM messages WHERE message_id = ?",
+                (str(message_id),)
+            )
+            await self._commit_deferred()
+            logger.debug("Deleted message %s", message_id)
+
+    async def _commit_deferred(self):  # caller holds _write_lock
+        """
+        Group-commit live message writes instead of one WAL commit each.
+
+        Busy channels, raids and mod sweeps otherwise pay a commit per row.
+        The write stays pending on this connection - every read here
+        (get_recent right after a store, attachments, events) already sees
+        it, and any other commit carries it along - and is committed within
+        DEFERRED_COMMIT_DELAY_S or once DEFERRED_COMMIT_MAX_OPS have queued,
+        whichever comes first. A crash can lose that window; boot backfill
+        re-fetches it.
+        """
+        self._deferred_ops += 1
+        if self._deferred_ops >= DEFERRED_COMMIT_MAX_OPS:
+            if self._deferred_commit_task:
+                self._deferred_commit_task.cancel()
+                self._deferred_commit_task = None
+            await self._flush_deferred()
+        elif self._deferred_commit_task is None:
+            self._deferred_commit_task = asyncio.create_task(self._deferred_commit_after_delay())
+
+    async def _deferred_commit_after_delay(self):
+        await asyncio.sleep(DEFERRED_COMMIT_DELAY_S)
+        self._deferred_commit_task = None
+        try:
+            async with self._write_lock:
+                await self._flush_deferred()
+        except Exception as e:
+            logger.error(f"Deferred commit failed: {e}", exc_info=True)
+
+    async def _flush_deferred(self):
+        """Commit queued edits/deletes, if any."""
+        if self._deferred_ops:
+            self._deferred_ops = 0
+            await self._db.commit()
 
     async def insert_system_message(
         self, content: str, channel_id: str, guild_id: str, timestamp: datetime
@@ -516,14 +930,15 @@ class MessageMemory:
         # is UNIQUE - a timestamp-only id made all but the first insert fail
         message_id = f"system_{channel_id}_{timestamp.timestamp()}"
 
-        try:
-            await self._db.execute(
+        async with self._write_lock:
+            cursor = await self._db.execute(
                 """
                 INSERT INTO messages (
                     message_id, channel_id, guild_id,
                     author_id, author_name, content,
-                    timestamp, is_bot, is_system, has_attachments, mentions
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    timestamp, is_bot, is_system, has_attachments
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(message_id) DO NOTHING
                 """,
                 (
                     message_id,
@@ -532,19 +947,19 @@ class MessageMemory:
                     "SYSTEM",  # author_id
                     "System",  # author_name
                     content,
-                    timestamp.isoformat(),
+                    _to_micros(timestamp),
                     False,  # is_bot
                     True,   # is_system
                     False,  # has_attachments
-                    "[]",   # mentions (empty)
                 ),
             )
-            await self._db.commit()
-            logger.info(f"Inserted system message: {content} at {timestamp}")
-
-        except aiosqlite.IntegrityError:
-            # System message already exists (e.g., duplicate startup)
-            logger.debug(f"System message already exists: {message_id}")
+            if not cursor.rowcount:
+                # System message already exists (e.g., duplicate startup)
+                logger.debug("System message already exists: %s", message_id)
+                return
+            # Lifecycle loops insert one per channel: let them share commits
+            await self._commit_deferred()
+        logger.info(f"Inserted system message: {content} at {timestamp}")
 
     async def get_recent(
         self, channel_id: str, limit: int = 20, exclude_message_ids: List[int] = None
@@ -564,30 +979,22 @@ class MessageMemory:
 
             cursor = await self._db.execute(
                 f"""
-                SELECT * FROM messages
-                WHERE channel_id = ?
-                AND message_id NOT IN ({placeholders})
-                ORDER BY timestamp DESC
-                LIMIT ?
+                SELECT * FROM (
+                    SELECT {_MESSAGE_COLUMNS} FROM messages
+                    WHERE channel_id = ?
+                    AND message_id NOT IN ({placeholders})
+                    ORDER BY timestamp DESC
+                    LIMIT ?
+                ) ORDER BY timestamp ASC
                 """,
                 (channel_id, *excluded_ids_str, limit),
             )
         else:
-            cursor = await self._db.execute(
-                """
-                SELECT * FROM messages
-                WHERE channel_id = ?
-                ORDER BY timestamp DESC
-                LIMIT ?
-                """,
-                (channel_id, limit),
-            )
+            cursor = await self._db.execute(_GET_RECENT_SQL, (channel_id, limit))
 
+        # Already chronological (oldest first)
         rows = await cursor.fetchall()
-        messages = [self._row_to_message(row) for row in rows]
-
-        # Return in chronological order (oldest first)
-        return list(reversed(messages))
+        return [self._row_to_message(row) for row in rows]
 
     async def get_first_messages(
         self, channel_id: str, limit: int = 20
@@ -597,8 +1004,8 @@ class MessageMemory:
             raise RuntimeError("MessageMemory not initialized. Call initialize() first.")
 
         cursor = await self._db.execute(
-            """
-            SELECT * FROM messages
+            f"""
+            SELECT {_MESSAGE_COLUMNS} FROM messages
             WHERE channel_id = ?
             ORDER BY timestamp ASC
             LIMIT ?
@@ -611,23 +1018,28 @@ class MessageMemory:
 
     async def get_since(
         self, channel_id: str, since: datetime
-    ) -> List[StoredMessage]:
-        """Get messages since specific timestamp"""
+    ) -> AsyncIterator[StoredMessage]:
+        """
+        Stream messages since specific timestamp, oldest first.
+
+        Rows are fetched from the cursor in chunks as the caller iterates,
+        so a caller that stops early never materializes the whole channel.
+        Wrap in contextlib.aclosing() when breaking out of the loop.
+        """
         if not self._db:
             raise RuntimeError("MessageMemory not initialized. Call initialize() first.")
 
-        cursor = await self._db.execute(
-            """
-            SELECT * FROM messages
+        async with self._db.execute(
+            f"""
+            SELECT {_MESSAGE_COLUMNS} FROM messages
             WHERE channel_id = ?
             AND timestamp > ?
             ORDER BY timestamp ASC
             """,
-            (channel_id, since.isoformat()),
-        )
-
-        rows = await cursor.fetchall()
-        return [self._row_to_message(row) for row in rows]
+            (channel_id, _to_micros(since)),
+        ) as cursor:
+            async for row in cursor:
+                yield self._row_to_message(row)
 
     async def get_episode_watermark(self, channel_id: str) -> Optional[str]:
         """Get last episodized message ID for a channel (None = never episodized)."""
@@ -664,16 +1076,16 @@ class MessageMemory:
         """
         if after_message_id is None:
             cursor = await self._db.execute(
-                """
-                SELECT * FROM messages WHERE channel_id = ? AND is_system = 0
+                f"""
+                SELECT {_MESSAGE_COLUMNS} FROM messages WHERE channel_id = ? AND is_system = 0
                 ORDER BY CAST(message_id AS INTEGER) ASC
                 """,
                 (channel_id,),
             )
         else:
             cursor = await self._db.execute(
-                """
-                SELECT * FROM messages
+                f"""
+                SELECT {_MESSAGE_COLUMNS} FROM messages
                 WHERE channel_id = ? AND is_system = 0
                   AND CAST(message_id AS INTEGER) > CAST(? AS INTEGER)
                 ORDER BY CAST(message_id AS INTEGER) ASC
@@ -771,7 +1183,7 @@ class MessageMemory:
             WHERE channel_id = ? AND is_system = 0 AND timestamp < ?
             ORDER BY CAST(message_id AS INTEGER) DESC LIMIT 1
             """,
-            (channel_id, cutoff.isoformat()),
+            (channel_id, _to_micros(cutoff)),
         )
         row = await cursor.fetchone()
         return row["message_id"] if row else None
@@ -780,22 +1192,24 @@ class MessageMemory:
         """channel_id -> created_at (aware UTC) of the newest stored message.
 
         One bulk query so boot backfill can resume each channel where the
-        last session stopped instead of re-fetching the whole window."""
+        last session stopped instead of re-fetching the whole window.
+        Lifecycle markers are skipped - on_ready writes one per channel
+        before backfill starts, which would make every channel look current."""
         cursor = await self._db.execute(
-            "SELECT channel_id, MAX(timestamp) FROM messages GROUP BY channel_id")
-        out = {}
-        for cid, ts in await cursor.fetchall():
-            try:
-                out[cid] = datetime.fromisoformat(ts)
-            except (TypeError, ValueError):
-                pass
-        return out
+            """
+            SELECT channel_id, MAX(timestamp) FROM messages
+            WHERE author_id != 'SYSTEM' GROUP BY channel_id
+            """)
+        return {
+            cid: _from_micros(ts).replace(tzinfo=timezone.utc)
+            for cid, ts in await cursor.fetchall()
+        }
 
     async def get_latest_message(self, channel_id: str) -> Optional[StoredMessage]:
         """Get the most recent non-system message in a channel, or None."""
         cursor = await self._db.execute(
-            """
-            SELECT * FROM messages WHERE channel_id = ? AND is_system = 0
+            f"""
+            SELECT {_MESSAGE_COLUMNS} FROM messages WHERE channel_id = ? AND is_system = 0
             ORDER BY CAST(message_id AS INTEGER) DESC LIMIT 1
             """,
             (channel_id,),
@@ -808,7 +1222,7 @@ class MessageMemory:
         """One stored message by id (durable - survives the live context window).
         Used to quote a replied-to message however old it is."""
         cursor = await self._db.execute(
-            "SELECT * FROM messages WHERE message_id = ? AND channel_id = ?",
+            f"SELECT {_MESSAGE_COLUMNS} FROM messages WHERE message_id = ? AND channel_id = ?",
             (str(message_id), str(channel_id)),
         )
         row = await cursor.fetchone()
@@ -821,14 +1235,14 @@ class MessageMemory:
         """Non-system messages after a cursor, oldest-first (v0.9 watches).
         after_message_id wins when set; after_timestamp (ISO string) is the
         fallback for a watch that has never been checked."""
-        query = "SELECT * FROM messages WHERE channel_id = ? AND is_system = 0"
+        query = f"SELECT {_MESSAGE_COLUMNS} FROM messages WHERE channel_id = ? AND is_system = 0"
         params: list = [str(channel_id)]
         if after_message_id is not None:
             query += " AND CAST(message_id AS INTEGER) > ?"
             params.append(int(after_message_id))
         elif after_timestamp is not None:
             query += " AND timestamp > ?"
-            params.append(after_timestamp)
+            params.append(_to_micros(datetime.fromisoformat(after_timestamp)))
         query += " ORDER BY CAST(message_id AS INTEGER) ASC LIMIT ?"
         params.append(limit)
         cursor = await self._db.execute(query, params)
@@ -840,32 +1254,29 @@ class MessageMemory:
         if not self._db:
             raise RuntimeError("MessageMemory not initialized. Call initialize() first.")
 
-        cursor = await self._db.execute(
-            "SELECT COUNT(*) FROM messages WHERE channel_id = ?", (channel_id,)
-        )
-        total_messages = (await cursor.fetchone())[0]
-
-        cursor = await self._db.execute(
-            "SELECT COUNT(DISTINCT author_id) FROM messages WHERE channel_id = ?",
-            (channel_id,),
-        )
-        unique_users = (await cursor.fetchone())[0]
+        # One pass over the channel's index range for all four aggregates
+        async with self._reader() as db:
+            cursor = await db.execute(
+                """
+                SELECT COUNT(*), COUNT(DISTINCT author_id), MIN(timestamp), MAX(timestamp)
+                FROM messages
+                WHERE channel_id = ?
+                """,
+                (channel_id,),
+            )
+            total_messages, unique_users, first_msg, last_msg = await cursor.fetchone()
 
-        cursor = await self._db.execute(
-            """
-            SELECT MIN(timestamp), MAX(timestamp)
-            FROM messages
-            WHERE channel_id = ?
-            """,
-            (channel_id,),
-        )
-        first_msg, last_msg = await cursor.fetchone()
+        def iso(us):
+            # first/last stay aware-UTC ISO strings; None for an empty channel
+            if us is None:
+                return None
+            return _from_micros(us).replace(tzinfo=timezone.utc).isoformat()
 
         return {
             "total_messages": total_messages,
             "unique_users": unique_users,
-            "first_message": first_msg,
-            "last_message": last_msg,
+            "first_message": iso(first_msg),
+            "last_message": iso(last_msg),
         }
 
     async def get_user_message_count(self, user_id: str, server_id: str = None) -> int:
@@ -884,15 +1295,46 @@ class MessageMemory:
         if not self._db:
             raise RuntimeError("MessageMemory not initialized. Call initialize() first.")
 
-        cutoff = datetime.utcnow() - timedelta(days=days)
+        cutoff = _to_micros(datetime.utcnow() - timedelta(days=days))
 
-        cursor = await self._db.execute(
-            "DELETE FROM messages WHERE timestamp < ?", (cutoff.isoformat(),)
-        )
-        await self._db.commit()
+        # Bounded batches, each its own transaction: the write lock (and
+        # SQLite's writer slot) is released between them so live messages
+        # aren't stalled behind one huge DELETE
+        deleted = 0
+        while True:
+            async with self._write_lock:
+                cursor = await self._db.execute(
+                    """
+                    DELETE FROM messages WHERE id IN (
+                        SELECT id FROM messages WHERE timestamp < ? LIMIT ?
+                    )
+                    """,
+                    (cutoff, CLEANUP_BATCH_SIZE),
+                )
+                await self._db.commit()
+                self._deferred_ops = 0  # the commit above covered them
+            deleted += cursor.rowcount
+            if cursor.rowcount < CLEANUP_BATCH_SIZE:
+                break
+            await asyncio.sleep(0)
+
+        if deleted:
+            # Guilds whose last message just aged out stop being "active" -
+            # one idx_guild_author prefix probe per guild
+            async with self._write_lock:
+                await self._db.execute(
+                    """
+                    DELETE FROM guilds WHERE NOT EXISTS (
+                        SELECT 1 FROM messages m WHERE m.guild_id = guilds.guild_id
+                    )
+                    """
+                )
+                await self._db.commit()
+                self._deferred_ops = 0
 
-        deleted = cursor.rowcount
         logger.info(f"Cleaned up {deleted} messages older than {days} days")
+        if deleted:
+            await self.optimize(analyze=True)
 
     async def get_active_servers(self) -> List[str]:
         """Get list of unique server/guild IDs from message history"""
@@ -900,7 +1342,7 @@ class MessageMemory:
             raise RuntimeError("MessageMemory not initialized. Call initialize() first.")
 
         cursor = await self._db.execute(
-            "SELECT DISTINCT guild_id FROM messages ORDER BY guild_id"
+            "SELECT guild_id FROM guilds ORDER BY guild_id"
         )
         rows = await cursor.fetchall()
         await cursor.close()
@@ -955,17 +1397,19 @@ class MessageMemory:
         if not self._db:
             raise RuntimeError("MessageMemory not initialized. Call initialize() first.")
 
-        cutoff = datetime.now() - timedelta(hours=hours)
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
+        # Existence probe - stops at the first idx_author_timestamp hit
         cursor = await self._db.execute(
             """
-            SELECT COUNT(*) FROM messages
+            SELECT 1 FROM messages
             WHERE author_id = ? AND timestamp > ?
+            LIMIT 1
             """,
-            (user_id, cutoff.isoformat())
+            (user_id, _to_micros(cutoff))
         )
         row = await cursor.fetchone()
         await cursor.close()
-        return row[0] > 0 if row else False
+        return row is not None
 
     async def get_message_context(
         self,
@@ -978,44 +1422,49 @@ class MessageMemory:
         if not self._db:
             raise RuntimeError("MessageMemory not initialized. Call initialize() first.")
 
-        # Get target message to know its timestamp
+        # Target, its window before and after, in one round trip: bucket -1/0/1
+        # orders the windows, timestamp orders rows within each
         cursor = await self._db.execute(
-            "SELECT * FROM messages WHERE message_id = ? AND channel_id = ?",
-            (message_id, channel_id)
-        )
-        target_row = await cursor.fetchone()
-
-        if not target_row:
-            return {"before": [], "match": None, "after": []}
-
-        target_msg = self._row_to_message(target_row)
-        target_timestamp = target_msg.timestamp
-
-        # Get messages before
-        cursor = await self._db.execute(
-            """
-            SELECT * FROM messages
-            WHERE channel_id = ? AND timestamp < ?
-            ORDER BY timestamp DESC
-            LIMIT ?
+            f"""
+            WITH target AS (
+                SELECT id, timestamp FROM messages WHERE message_id = ? AND channel_id = ?
+            )
+            SELECT 0 AS bucket, {_MESSAGE_COLUMNS} FROM messages, target
+            WHERE messages.id = target.id
+            UNION ALL
+            SELECT * FROM (
+                SELECT -1, {_MESSAGE_COLUMNS} FROM messages
+                WHERE channel_id = ? AND timestamp < (SELECT timestamp FROM target)
+                ORDER BY timestamp DESC
+                LIMIT ?
+            )
+            UNION ALL
+            SELECT * FROM (
+                SELECT 1, {_MESSAGE_COLUMNS} FROM messages
+                WHERE channel_id = ? AND timestamp > (SELECT timestamp FROM target)
+                ORDER BY timestamp ASC
+                LIMIT ?
+            )
+            ORDER BY bucket, timestamp
             """,
-            (channel_id, target_timestamp.isoformat(), before)
+            (message_id, channel_id, channel_id, before, channel_id, after)
         )
-        before_rows = await cursor.fetchall()
-        before_messages = [self._row_to_message(row) for row in reversed(before_rows)]
+        rows = await cursor.fetchall()
 
-        # Get messages after
-        cursor = await self._db.execute(
-            """
-            SELECT * FROM messages
-            WHERE channel_id = ? AND timestamp > ?
-            ORDER BY timestamp ASC
-            LIMIT ?
-            """,
-            (channel_id, target_timestamp.isoformat(), after)
-        )
-        after_rows = await cursor.fetchall()
-        after_messages = [self._row_to_message(row) for row in after_rows]
+        target_msg = None
+        before_messages: List[StoredMessage] = []
+        after_messages: List[StoredMessage] = []
+        for row in rows:
+            msg = self._row_to_message(row[1:])
+            if row[0] < 0:
+                before_messages.append(msg)
+            elif row[0] > 0:
+                after_messages.append(msg)
+            else:
+                target_msg = msg
+
+        if target_msg is None:
+            return {"before": [], "match": None, "after": []}
 
         return {
             "before": before_messages,
@@ -1087,7 +1536,7 @@ class MessageMemory:
         params.append(limit)
 
         sql = f"""
-            SELECT m.*
+            SELECT {_MESSAGE_COLUMNS_M}
             FROM messages_fts
             JOIN messages m ON messages_fts.rowid = m.id
             WHERE messages_fts MATCH ? AND {where_clause}
@@ -1095,14 +1544,15 @@ class MessageMemory:
             LIMIT ?
             """
 
-        try:
-            cursor = await self._db.execute(sql, tuple(params))
-        except sqlite3.OperationalError:
-            # Malformed explicit FTS5 syntax: retry as a literal quoted phrase
-            params[0] = '"{}"'.format(query.replace('"', '""'))
-            cursor = await self._db.execute(sql, tuple(params))
+        async with self._reader() as db:
+            try:
+                cursor = await db.execute(sql, tuple(params))
+            except sqlite3.OperationalError:
+                # Malformed explicit FTS5 syntax: retry as a literal quoted phrase
+                params[0] = '"{}"'.format(query.replace('"', '""'))
+                cursor = await db.execute(sql, tuple(params))
+            rows = await cursor.fetchall()
 
-        rows = await cursor.fetchall()
         return [self._row_to_message(row) for row in rows]
 
     async def get_active_authors(self, server_id: str, since: datetime) -> List[str]:
@@ -1112,7 +1562,7 @@ class MessageMemory:
             SELECT DISTINCT author_id FROM messages
             WHERE guild_id = ? AND is_bot = 0 AND is_system = 0 AND timestamp > ?
             """,
-            (server_id, since.isoformat()),
+            (server_id, _to_micros(since)),
         )
         rows = await cursor.fetchall()
         return [r["author_id"] for r in rows]
@@ -1123,8 +1573,8 @@ class MessageMemory:
     ) -> List[StoredMessage]:
         """Latest messages by one user in one server (newest first), for
         profile-rewrite evidence."""
-        sql = """
-            SELECT * FROM messages
+        sql = f"""
+            SELECT {_MESSAGE_COLUMNS} FROM messages
             WHERE author_id = ? AND guild_id = ? AND is_system = 0
         """
         params: list = [author_id, server_id]
@@ -1139,25 +1589,21 @@ class MessageMemory:
         return [self._row_to_message(r) for r in rows]
 
     def _row_to_message(self, row: aiosqlite.Row) -> StoredMessage:
-        """Convert database row to StoredMessage"""
-        timestamp = datetime.fromisoformat(row["timestamp"])
-        # Strip timezone to ensure all timestamps are naive UTC
-        if timestamp.tzinfo is not None:
-            timestamp = timestamp.replace(tzinfo=None)
-
-        mentions_json = row["mentions"]
-        mentions = json.loads(mentions_json) if mentions_json else []
+        """Convert a _MESSAGE_COLUMNS row to StoredMessage"""
+        # Positional unpack: a Row name lookup scans the column names per call
+        (message_id, channel_id, guild_id, author_id, author_name, content,
+         timestamp, is_bot, is_system, has_attachments, mention_ids) = row
 
         return StoredMessage(
-            message_id=row["message_id"],
-            channel_id=row["channel_id"],
-            guild_id=row["guild_id"],
-            author_id=row["author_id"],
-            author_name=row["author_name"],
-            content=row["content"],
-            timestamp=timestamp,
-            is_bot=bool(row["is_bot"]),
-            is_system=bool(row["is_system"]) if "is_system" in row.keys() else False,
-            has_attachments=bool(row["has_attachments"]),
-            mentions=mentions,
+            message_id=message_id,
+            channel_id=channel_id,
+            guild_id=guild_id,
+            author_id=author_id,
+            author_name=author_name,
+            content=content,
+            timestamp=_from_micros(timestamp),
+            is_bot=bool(is_bot),
+            is_system=bool(is_system),  # column guaranteed by _run_migrations
+            has_attachments=bool(has_attachments),
+            mentions=mention_ids.split(",") if mention_ids else [],
         )
@@ -7,8 +7,20 @@ Represents autonomous actions: follow-ups, proactive engagement, maintenance.
 from dataclasses import dataclass
 from typing import Optional
 
+VALID_TYPES = ("followup", "proactive", "maintenance", "coordination")
+VALID_PRIORITIES = ("high", "medium", "low")
+VALID_DELIVERY_METHODS = ("immediate", "standalone", "woven", "deferred")
 
-@dataclass
+# delivery_method -> (execute while channel idle, execute while channel active)
+_EXECUTE_NOW = {
+    "immediate": (True, True),
+    "standalone": (True, False),
+    "woven": (False, True),
+    "deferred": (False, False),
+}
+
+
+@dataclass(slots=True, frozen=True)
 class ProactiveAction:
     """
     Represents a proactive action the bot should take.
@@ -30,17 +42,17 @@ class ProactiveAction:
 
     def __post_init__(self):
         """Validate action fields"""
-        valid_types = ["followup", "proactive", "maintenance", "coordination"]
-        if self.type not in valid_types:
-            raise ValueError(f"Invalid type: {self.type}. Must be {valid_types}")
+        if self.type not in VALID_TYPES:
+            raise ValueError(f"Invalid type: {self.type}. Must be {list(VALID_TYPES)}")
 
-        valid_priorities = ["high", "medium", "low"]
-        if self.priority not in valid_priorities:
-            raise ValueError(f"Invalid priority: {self.priority}. Must be {valid_priorities}")
+        if self.priority not in VALID_PRIORITIES:
+            raise ValueError(f"Invalid priority: {self.priority}. Must be {list(VALID_PRIORITIES)}")
 
-        valid_delivery = ["immediate", "standalone", "woven", "deferred"]
-        if self.delivery_method not in valid_delivery:
-            raise ValueError(f"Invalid delivery_method: {self.delivery_method}. Must be {valid_delivery}")
+        if self.delivery_method not in VALID_DELIVERY_METHODS:
+            raise ValueError(
+                f"Invalid delivery_method: {self.delivery_method}. "
+                f"Must be {list(VALID_DELIVERY_METHODS)}"
+            )
 
     def should_execute_now(self, channel_active: bool) -> bool:
         """
@@ -51,13 +63,5 @@ class ProactiveAction:
         woven: Execute when channel is active (weave into conversation)
         deferred: Never execute immediately
         """
-        if self.delivery_method == "immediate":
-            return True
-        if self.delivery_method == "standalone":
-            return not channel_active
-        elif self.delivery_method == "woven":
-            return channel_active
-        elif self.delivery_method == "deferred":
-            return False
-
-        return False
+        # delivery_method is validated in __post_init__, so always a key
+        return _EXECUTE_NOW[self.delivery_method][bool(channel_active)]
@@ -6,10 +6,10 @@ small servers. v0.11.3: silence auto-expires so an ignored streak backs the
 bot off instead of muting it until the next @mention.
 """
 
-from collections import defaultdict
-from datetime import datetime, timedelta
-from typing import Tuple, Optional, Dict
+from collections import defaultdict, deque
+from typing import Callable, Tuple, Optional, Dict
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -25,15 +25,21 @@ class RateLimiter:
     bot goes silent. Engagement reduces ignore count.
     """
 
-    def __init__(self, config: Optional[Dict] = None):
-        # Track response timestamps per channel
-        self.response_times: Dict[str, list] = defaultdict(list)
+    def __init__(self, config: Optional[Dict] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            config: Window/threshold overrides (see defaults below)
+            clock: Monotonic seconds source - e.g. the running event loop's
+                   loop.time, or a fake clock in tests
+        """
+        self._clock = clock
 
         # Track consecutive ignores per channel
         self.ignored_count: Dict[str, int] = defaultdict(int)
 
-        # When each channel crossed the silence threshold (None = not silenced)
-        self.silence_started: Dict[str, Optional[datetime]] = defaultdict(lambda: None)
+        # When each channel crossed the silence threshold (absent = not silenced)
+        self.silence_started: Dict[str, float] = {}
 
         # Configuration with defaults
         config = config or {}
@@ -44,6 +50,17 @@ class RateLimiter:
         self.ignore_threshold = config.get("ignore_threshold", 5)
         self.silence_expiry_minutes = config.get("silence_expiry_minutes", 30)
 
+        # All timestamps are clock() seconds: cheap float compares,
+        # and wall-clock jumps (NTP, DST) can't open or close a window
+        self._short_window_s = self.short_window_minutes * 60.0
+        self._long_window_s = self.long_window_minutes * 60.0
+        self._silence_expiry_s = self.silence_expiry_minutes * 60.0
+
+        # Track response timestamps per channel, oldest first. Nothing past
+        # long_window_max can matter: that many in the window already blocks.
+        self.response_times: Dict[str, deque] = defaultdict(
+            lambda: deque(maxlen=self.long_window_max))
+
     def can_respond(self, channel_id: str, is_mention: bool = False) -> Tuple[bool, Optional[str]]:
         """
         Check if bot can respond in channel.
@@ -55,43 +72,34 @@ class RateLimiter:
         Returns: (can_respond, reason_if_blocked)
         Reasons: None, "rate_limit_short", "rate_limit_long", "ignored_threshold"
         """
-        now = datetime.now()
-        times = self.response_times[channel_id]
-
-        # Clean up old responses outside long window
-        cutoff = now - timedelta(minutes=self.long_window_minutes)
-        times = [t for t in times if t > cutoff]
-        self.response_times[channel_id] = times
+        now = self._clock()
+        times = self._live_times(channel_id, now)
 
         # Check short window
-        short_cutoff = now - timedelta(minutes=self.short_window_minutes)
-        short_window_responses = [t for t in times if t > short_cutoff]
-
-        if len(short_window_responses) >= self.short_window_max:
-            logger.debug(
-                f"Channel {channel_id}: Rate limit (short) - "
-                f"{len(short_window_responses)}/{self.short_window_max}"
-            )
+        short_window_responses = self._short_window_count(times, now)
+
+        if short_window_responses >= self.short_window_max:
+            logger.debug("Channel %s: Rate limit (short) - %d/%d",
+                         channel_id, short_window_responses, self.short_window_max)
             return False, "rate_limit_short"
 
         # Check long window
         if len(times) >= self.long_window_max:
-            logger.debug(
-                f"Channel {channel_id}: Rate limit (long) - "
-                f"{len(times)}/{self.long_window_max}"
-            )
+            logger.debug("Channel %s: Rate limit (long) - %d/%d",
+                         channel_id, len(times), self.long_window_max)
             return False, "rate_limit_long"
 
         # Check ignore threshold - @mentions bypass this
-        if self.ignored_count[channel_id] >= self.ignore_threshold:
+        ignored = self.ignored_count.get(channel_id, 0)
+        if ignored >= self.ignore_threshold:
             if is_mention:
                 logger.info(
                     f"Channel {channel_id}: @mention bypasses silence threshold "
-                    f"({self.ignored_count[channel_id]}/{self.ignore_threshold})"
+                    f"({ignored}/{self.ignore_threshold})"
                 )
                 # Reset ignore count on mention - someone is explicitly engaging
-                self.ignored_count[channel_id] = 0
-                self.silence_started[channel_id] = None
+                self.ignored_count.pop(channel_id, None)
+                self.silence_started.pop(channel_id, None)
             elif self._silence_expired(channel_id, now):
                 # Back-off served: allow one trial message. Set the counter to
                 # threshold-1 so another ignore re-silences immediately while
@@ -101,68 +109,93 @@ class RateLimiter:
                     f"{self.silence_expiry_minutes}min - allowing trial message"
                 )
                 self.ignored_count[channel_id] = self.ignore_threshold - 1
-                self.silence_started[channel_id] = None
+                self.silence_started.pop(channel_id, None)
             else:
-                logger.debug(
-                    f"Channel {channel_id}: Silenced - "
-                    f"{self.ignored_count[channel_id]}/{self.ignore_threshold}"
-                )
+                logger.debug("Channel %s: Silenced - %d/%d",
+                             channel_id, ignored, self.ignore_threshold)
                 return False, "ignored_threshold"
 
         return True, None
 
     def record_response(self, channel_id: str):
         """Record that bot sent a message"""
-        self.response_times[channel_id].append(datetime.now())
-        logger.debug(
-            f"Channel {channel_id}: Response recorded "
-            f"(total: {len(self.response_times[channel_id])})"
-        )
+        self.response_times[channel_id].append(self._clock())
+        logger.debug("Channel %s: Response recorded (total: %d)",
+                     channel_id, len(self.response_times[channel_id]))
 
     def record_ignored(self, channel_id: str):
         """Record that bot was ignored (no engagement within tracking window)"""
         self.ignored_count[channel_id] += 1
 
         count = self.ignored_count[channel_id]
-        logger.debug(
-            f"Channel {channel_id}: Ignored count {count}/{self.ignore_threshold}"
-        )
+        logger.debug("Channel %s: Ignored count %d/%d",
+                     channel_id, count, self.ignore_threshold)
 
         if count >= self.ignore_threshold:
-            if self.silence_started[channel_id] is None:
-                self.silence_started[channel_id] = datetime.now()
+            if channel_id not in self.silence_started:
+                self.silence_started[channel_id] = self._clock()
             logger.info(f"Channel {channel_id}: Silence threshold reached")
 
     def record_engagement(self, channel_id: str):
         """Record engagement (reaction/reply). Reduces ignore counter."""
-        # Don't go negative
-        self.ignored_count[channel_id] = max(0, self.ignored_count[channel_id] - 1)
+        # Don't go negative; a channel back at zero keeps no entry
+        count = max(0, self.ignored_count.get(channel_id, 0) - 1)
+        if count:
+            self.ignored_count[channel_id] = count
+        else:
+            self.ignored_count.pop(channel_id, None)
 
-        if self.ignored_count[channel_id] < self.ignore_threshold:
-            self.silence_started[channel_id] = None
+        if count < self.ignore_threshold:
+            self.silence_started.pop(channel_id, None)
 
-        logger.debug(
-            f"Channel {channel_id}: Engagement! "
-            f"Ignore count now {self.ignored_count[channel_id]}"
-        )
+        logger.debug("Channel %s: Engagement! Ignore count now %d",
+                     channel_id, count)
 
-    def _silence_expired(self, channel_id: str, now: datetime) -> bool:
+    def _live_times(self, channel_id: str, now: float) -> deque:
+        """
+        Channel's response times with entries outside the long window
+        dropped (usually none), so len() is the long window count.
+
+        Read-only lookup: a channel that has aged out of the long window is
+        removed rather than kept as an empty deque, and one never recorded
+        isn't added - per-channel state stays bounded by active channels.
+        """
+        times = self.response_times.get(channel_id)
+        if times is None:
+            return deque()
+        cutoff = now - self._long_window_s
+        while times and times[0] <= cutoff:
+            times.popleft()
+        if not times:
+            del self.response_times[channel_id]
+        return times
+
+    def _short_window_count(self, times: deque, now: float) -> int:
+        """
+        Responses in the short window - walks back from the newest end and
+        stops at the first older entry, so cost is bounded by the short
+        window's size, not the history depth.
+        """
+        cutoff = now - self._short_window_s
+        count = 0
+        for t in reversed(times):
+            if t <= cutoff:
+                break
+            count += 1
+        return count
+
+    def _silence_expired(self, channel_id: str, now: float) -> bool:
         """True when the channel's silence back-off period has elapsed."""
-        started = self.silence_started[channel_id]
-        return (started is not None
-                and now - started > timedelta(minutes=self.silence_expiry_minutes))
+        started = self.silence_started.get(channel_id)
+        return started is not None and now - started > self._silence_expiry_s
 
     def get_stats(self, channel_id: str) -> Dict:
         """Get current rate limit stats for debugging/monitoring"""
-        now = datetime.now()
-        times = self.response_times[channel_id]
-
-        short_cutoff = now - timedelta(minutes=self.short_window_minutes)
-        long_cutoff = now - timedelta(minutes=self.long_window_minutes)
-
-        responses_5min = len([t for t in times if t > short_cutoff])
-        responses_1hr = len([t for t in times if t > long_cutoff])
-        ignored = self.ignored_count[channel_id]
+        now = self._clock()
+        times = self._live_times(channel_id, now)
+        responses_5min = self._short_window_count(times, now)
+        responses_1hr = len(times)
+        ignored = self.ignored_count.get(channel_id, 0)
 
         return {
             "responses_5min": responses_5min,
@@ -177,7 +210,7 @@ class RateLimiter:
 
     def reset_channel(self, channel_id: str):
         """Reset all limits for channel (testing/manual intervention)"""
-        self.response_times[channel_id].clear()
-        self.ignored_count[channel_id] = 0
-        self.silence_started[channel_id] = None
+        self.response_times.pop(channel_id, None)
+        self.ignored_count.pop(channel_id, None)
+        self.silence_started.pop(channel_id, None)
         logger.info(f"Channel {channel_id}: Rate limits reset")
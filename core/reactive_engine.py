@@ -273,7 +273,9 @@ class ReactiveEngine:
         # on_ready); feeds the DM prime-context line (v0.9).
         self.list_servers = None
 
-        # Initialize Anthropic client
+        # Initialize Anthropic client - the one client (and keep-alive
+        # connection pool) for messages, file uploads, skills and the agentic
+        # engine; closed by BotManager.shutdown() after both engines stop
         self.anthropic = AsyncAnthropic(api_key=anthropic_api_key)
 
         # Cache internal config values (v0.6.0 - simplified config)
@@ -323,7 +325,7 @@ class ReactiveEngine:
         self.skills_manager = SkillsManager(
             skills_dir=Path(skills_config["skills_dir"]),
             cache_file=Path(skills_config["cache_file"]),
-            anthropic_api_key=anthropic_api_key
+            anthropic_client=self.anthropic
         )
         logger.info(f"Skills manager initialized with directory: {skills_config['skills_dir']}")
 
@@ -876,19 +878,14 @@ class ReactiveEngine:
         if not should_process:
             return []
 
+        results = await self.attachment_manager.process_attachments(
+            message.attachments, message, is_realtime=True
+        )
         processed = []
-        for attachment in message.attachments:
-            try:
-                result = await self.attachment_manager.process_attachment(
-                    attachment=attachment,
-                    message=message,
-                    is_realtime=True
-                )
-                if result and result.get("for_api"):
-                    processed.append(result)
-                    logger.info(f"Processed attachment: {attachment.filename}")
-            except Exception as e:
-                logger.error(f"Failed to process attachment {attachment.filename}: {e}", exc_info=True)
+        for attachment, result in zip(message.attachments, results):
+            if result and result.get("for_api"):
+                processed.append(result)
+                logger.info(f"Processed attachment: {attachment.filename}")
         return processed
 
     async def _reply_quote_prefix(self, message: discord.Message) -> str:
@@ -1251,7 +1248,7 @@ class ReactiveEngine:
                 path = block.input.get('path', 'unknown')
                 logger.debug(f"Executing memory tool: {command} {path}")
 
-                result = self.memory_tool_executor.execute(
+                result = await self.memory_tool_executor.execute(
                     block.input,
                     current_server_id=server_id,
                     current_channel_id=channel_id,
@@ -1898,8 +1895,6 @@ class ReactiveEngine:
                     self.conversation_logger.log_context_building(**context["stats"])
 
                 async with message.channel.typing():
-                    await asyncio.sleep(1.5)  # small delay for a more natural feel
-
                     # One cached system block; per-request context rides the
                     # volatile tail so it never breaks the cached prefix
                     system_blocks = [{
@@ -41,7 +41,8 @@ class SkillsManager:
         self,
         skills_dir: Path = Path("skills"),
         cache_file: Path = Path(".skills_cache.json"),
-        anthropic_api_key: Optional[str] = None
+        anthropic_api_key: Optional[str] = None,
+        anthropic_client: Optional[AsyncAnthropic] = None
     ):
         """
         Initialize Skills Manager.
@@ -50,13 +51,17 @@ class SkillsManager:
             skills_dir: Directory containing skill .zip files or skill folders
             cache_file: Path to cache file for tracking uploads
             anthropic_api_key: Anthropic API key for uploading skills
+            anthropic_client: Existing client to reuse (shares its connection
+                pool); takes precedence over anthropic_api_key
         """
         self.skills_dir = skills_dir
         self.cache_file = cache_file
         self.cache: Dict[str, Dict] = {}
         # Async client: skill uploads and list pagination are slow HTTP calls
         # that ran during on_ready - a sync client stalls the gateway heartbeat
-        self.anthropic_client = AsyncAnthropic(api_key=anthropic_api_key) if anthropic_api_key else None
+        if anthropic_client is None and anthropic_api_key:
+            anthropic_client = AsyncAnthropic(api_key=anthropic_api_key)
+        self.anthropic_client = anthropic_client
 
         # Ensure skills directory exists
         self.skills_dir.mkdir(parents=True, exist_ok=True)
@@ -8,15 +8,17 @@ Coordinates all attachment operations across storage modes:
 """
 
 import asyncio
+import hashlib
 import logging
-from typing import Optional, Dict, TYPE_CHECKING
+from collections import OrderedDict
+from typing import Optional, Dict, List, Tuple, TYPE_CHECKING
 import discord
 from anthropic import AsyncAnthropic
 
 from core.files_api_client import FilesAPIClient
 from core.local_storage_manager import LocalStorageManager
 from core.attachment_classifier import AttachmentClassifier
-from core.internal_constants import format_size
+from core.internal_constants import format_size, UPLOAD_DEDUP_CACHE_SIZE
 from core.attachment_database import AttachmentDatabase
 from tools.image_processor import ImageProcessor
 
@@ -98,11 +100,69 @@ class UnifiedAttachmentManager:
         # must not race the file_id check past each other (duplicate uploads)
         self._upload_locks: Dict[str, asyncio.Lock] = {}
 
+        # Recent realtime uploads by content: (sha256, filename) -> file_id.
+        # A file reposted under the same name reuses the earlier upload
+        self._upload_cache: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        # Uploads still in flight, same key: concurrent identical attachments
+        # (one message, or simultaneous reposts) await the first upload
+        self._uploads_in_flight: Dict[Tuple[str, str], asyncio.Future] = {}
+
     def _upload_lock_for(self, attachment_id: str) -> asyncio.Lock:
         if attachment_id not in self._upload_locks:
             self._upload_locks[attachment_id] = asyncio.Lock()
         return self._upload_locks[attachment_id]
 
+    async def _upload_deduped(self, filename: str, file_data: bytes) -> Optional[str]:
+        """
+        Upload to the Files API unless the same bytes under the same filename
+        were uploaded recently - reposts share one file_id instead of
+        spending bandwidth and Files API storage on a copy.
+
+        Returns:
+            file_id, None if the upload failed
+        """
+        digest = await asyncio.to_thread(lambda: hashlib.sha256(file_data).hexdigest())
+        key = (digest, filename)
+        file_id = self._upload_cache.get(key)
+        if file_id:
+            self._upload_cache.move_to_end(key)
+            logger.info(f"Identical upload of {filename}, reusing {file_id}")
+            return file_id
+
+        in_flight = self._uploads_in_flight.get(key)
+        if in_flight is not None:
+            # Shielded: a cancelled waiter mustn't cancel the shared result
+            file_id = await asyncio.shield(in_flight)
+            if file_id:
+                logger.info(f"Identical concurrent upload of {filename}, reusing {file_id}")
+            return file_id
+
+        in_flight = asyncio.get_running_loop().create_future()
+        self._uploads_in_flight[key] = in_flight
+        file_id = None
+        try:
+            upload_result = await self.files_api_client.upload(
+                filename=filename,
+                file_data=file_data,
+                mime_type=AttachmentClassifier.get_files_api_mime_type(filename)
+            )
+            if upload_result:
+                file_id = upload_result["file_id"]
+                self._upload_cache[key] = file_id
+                if len(self._upload_cache) > UPLOAD_DEDUP_CACHE_SIZE:
+                    self._upload_cache.popitem(last=False)
+        finally:
+            # Failed or cancelled uploads leave no entry - the next repost
+            # tries afresh - and waiters always get an answer
+            del self._uploads_in_flight[key]
+            in_flight.set_result(file_id)
+        return file_id
+
+    def _forget_upload(self, file_id: str) -> None:
+        """Drop a deleted/expired file_id so no later repost is handed it."""
+        for key in [k for k, v in self._upload_cache.items() if v == file_id]:
+            del self._upload_cache[key]
+
     async def initialize(self) -> None:
         """Create schema and run migrations."""
         await self.attachment_db.create_schema()
@@ -159,6 +219,27 @@ class UnifiedAttachmentManager:
             logger.error(f"Error processing attachment {attachment.id}: {e}", exc_info=True)
             return None
 
+    async def process_attachments(
+        self,
+        attachments: List[discord.Attachment],
+        message: discord.Message,
+        is_realtime: bool = True
+    ) -> List[Optional[Dict]]:
+        """
+        Process a message's attachments concurrently.
+
+        Downloads and Files API uploads overlap, so a message with several
+        attachments waits for the slowest one rather than the sum of all.
+        process_attachment never raises, so one failure can't cancel the rest.
+
+        Returns:
+            process_attachment results, in attachment order
+        """
+        return await asyncio.gather(*(
+            self.process_attachment(attachment, message, is_realtime)
+            for attachment in attachments
+        ))
+
     async def _process_attachment(
         self,
         attachment: discord.Attachment,
@@ -255,16 +336,9 @@ class UnifiedAttachmentManager:
 
             # No cached file_id - proceed with upload
             # For non-image files: upload to Files API with correct MIME type
-            mime_type = AttachmentClassifier.get_files_api_mime_type(attachment.filename)
-            upload_result = await self.files_api_client.upload(
-                filename=attachment.filename,
-                file_data=file_data,
-                mime_type=mime_type
-            )
-
-            if upload_result:
-                file_id = upload_result["file_id"]
+            file_id = await self._upload_deduped(attachment.filename, file_data)
 
+            if file_id:
                 # Update database with file_id
                 await self.attachment_db.db.execute(
                     "UPDATE attachments SET file_id = ?, file_api_uploaded_at = CURRENT_TIMESTAMP WHERE attachment_id = ?",
@@ -325,6 +399,15 @@ class UnifiedAttachmentManager:
                 except Exception as e:
                     logger.warning(f"Could not delete local copy of {filename}: {e}")
             if file_id:
+                self._forget_upload(file_id)
+                # A repost elsewhere may share this upload - keep it for them
+                async with self.attachment_db.db.execute(
+                    "SELECT 1 FROM attachments WHERE file_id = ? AND message_id != ? LIMIT 1",
+                    (file_id, str(message_id))
+                ) as cursor:
+                    shared = await cursor.fetchone()
+                if shared:
+                    continue
                 try:
                     await self.files_api_client.delete(file_id)
                 except Exception as e:
@@ -566,6 +649,7 @@ class UnifiedAttachmentManager:
         Returns:
             New file_id if re-upload succeeds, None otherwise
         """
+        self._forget_upload(file_id)
         if not self.local_storage.exists(local_path):
             logger.error(f"Cannot recover from expiration: local_path missing {local_path}")
             return None
@@ -585,10 +669,12 @@ class UnifiedAttachmentManager:
             if upload_result:
                 new_file_id = upload_result["file_id"]
 
-                # Update database with new file_id
+                # Move every row sharing the expired upload (reposts deduped
+                # onto one file_id) to the new one, not just this attachment
                 await self.attachment_db.db.execute(
-                    "UPDATE attachments SET file_id = ?, file_api_uploaded_at = CURRENT_TIMESTAMP WHERE attachment_id = ?",
-                    (new_file_id, attachment_id)
+                    "UPDATE attachments SET file_id = ?, file_api_uploaded_at = CURRENT_TIMESTAMP "
+                    "WHERE file_id = ? OR attachment_id = ?",
+                    (new_file_id, file_id, attachment_id)
                 )
                 await self.attachment_db.db.commit()
 
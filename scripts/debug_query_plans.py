@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Debug script for checking MessageMemory query plans.
+
+Runs EXPLAIN QUERY PLAN for the hot message-store queries against a bot's
+messages DB and flags the plan steps that mean an index is missing or unused:
+
+1. SCAN messages            - full table scan
+2. USE TEMP B-TREE          - sort/distinct not served by an index
+3. VIRTUAL TABLE INDEX 0    - FTS scanned without its MATCH constraint
+
+get_recent's outer ORDER BY sorts only its LIMIT rows and is expected.
+
+Usage:
+    python scripts/debug_query_plans.py persistence/<bot_id>_messages.db
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.message_memory import _GET_RECENT_SQL, _MESSAGE_COLUMNS, _MESSAGE_COLUMNS_M
+
+# (name, sql, params, temp b-tree expected)
+QUERIES = [
+    ("get_recent", _GET_RECENT_SQL, ("0", 20), True),
+    ("get_since",
+     f"SELECT {_MESSAGE_COLUMNS} FROM messages WHERE channel_id = ? AND timestamp > ?"
+     " ORDER BY timestamp ASC", ("0", 0), False),
+    ("get_channel_stats",
+     "SELECT COUNT(*), COUNT(DISTINCT author_id), MIN(timestamp), MAX(timestamp)"
+     " FROM messages WHERE channel_id = ?", ("0",), True),
+    ("get_users_in_server",
+     "SELECT DISTINCT author_id FROM messages WHERE guild_id = ? ORDER BY author_id",
+     ("0",), False),
+    ("check_user_activity",
+     "SELECT 1 FROM messages WHERE author_id = ? AND timestamp > ? LIMIT 1", ("0", 0), False),
+    ("cleanup_old", "DELETE FROM messages WHERE timestamp < ?", (0,), False),
+    ("supervisor per-day count",
+     "SELECT COUNT(*) FROM messages WHERE timestamp >= ? AND timestamp < ?", (0, 1), False),
+    ("get_active_servers", "SELECT guild_id FROM guilds ORDER BY guild_id", (), False),
+    # Must be driven by MATCH (rowid join into messages, rank order from FTS),
+    # with the channel/author filters applied to the joined rows
+    ("search_messages",
+     f"SELECT {_MESSAGE_COLUMNS_M} FROM messages_fts JOIN messages m ON messages_fts.rowid = m.id"
+     " WHERE messages_fts MATCH ? AND m.channel_id = ? AND m.author_id = ?"
+     " ORDER BY rank LIMIT ?", ("hello", "0", "0", 20), False),
+]
+
+
+def main():
+    if len(sys.argv) != 2:
+        print(__doc__)
+        sys.exit(1)
+
+    db_path = Path(sys.argv[1])
+    if not db_path.exists():
+        print(f"ERROR: {db_path} does not exist")
+        sys.exit(1)
+
+    con = sqlite3.connect(f"file:{db_path.as_posix()}?mode=ro", uri=True)
+
+    print("=" * 60)
+    print(f"Query plans for {db_path}")
+    print("=" * 60)
+
+    problems = 0
+    for name, sql, params, temp_ok in QUERIES:
+        print(f"\n[{name}]")
+        try:
+            rows = con.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+        except sqlite3.OperationalError as e:
+            print(f"    ERROR: {e}")
+            problems += 1
+            continue
+        for row in rows:
+            detail = row[3]
+            flag = ""
+            if detail.split()[:2] == ["SCAN", "messages"]:
+                flag = "  <-- full table scan"
+            elif "VIRTUAL TABLE INDEX 0:" in detail:
+                flag = "  <-- FTS scan without MATCH"
+            elif "TEMP B-TREE" in detail and not temp_ok:
+                flag = "  <-- unindexed sort"
+            problems += bool(flag)
+            print(f"    {detail}{flag}")
+
+    con.close()
+    print("\n" + "=" * 60)
+    print(f"{problems} flagged step(s)")
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -32,6 +32,30 @@ def _today_iso() -> str:
     return datetime.now(timezone.utc).date().isoformat()
 
 
+# messages.timestamp is integer epoch microseconds (UTC); the events table
+# and everything handed to the UI stay ISO strings.
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _micros(dt: datetime) -> int:
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - _EPOCH) // _MICROSECOND
+
+
+def _iso_from_micros(us: Optional[int]) -> Optional[str]:
+    if us is None:
+        return None
+    return (_EPOCH + timedelta(microseconds=us)).isoformat()
+
+
+def _day_start_micros(days_ago: int = 0) -> int:
+    """Epoch microseconds at UTC midnight, days_ago days back."""
+    day = datetime.now(timezone.utc).date() - timedelta(days=days_ago)
+    return _micros(datetime(day.year, day.month, day.day, tzinfo=timezone.utc))
+
+
 def _connect_ro(path: Path) -> Optional[sqlite3.Connection]:
     """Read-only sqlite open; None when the DB doesn't exist yet."""
     if not path.exists():
@@ -195,9 +219,9 @@ class BotData:
         db = self.root.messages_db(bot_id)
         out = []
         for i in range(6, -1, -1):
-            day = (datetime.now(timezone.utc) - timedelta(days=i)).date().isoformat()
             rows = _query(db, "SELECT COUNT(*) AS n FROM messages"
-                              " WHERE substr(timestamp, 1, 10) = ?", (day,))
+                              " WHERE timestamp >= ? AND timestamp < ?",
+                          (_day_start_micros(i), _day_start_micros(i - 1)))
             out.append(rows[0]["n"] if rows else 0)
         return out
 
@@ -218,7 +242,7 @@ class BotData:
             last = _query(db, "SELECT channel_id, timestamp FROM messages"
                               " ORDER BY id DESC LIMIT 1")
             today = _query(db, "SELECT COUNT(*) AS n FROM messages"
-                               " WHERE timestamp >= ?", (_today_iso(),))
+                               " WHERE timestamp >= ?", (_day_start_micros(),))
             episodes = len(list(self.root.memories_dir(bot_id).rglob("episodes/*.md")))
 
             ceiling = (config.get("api") or {}).get("context_tokens", 80000)
@@ -238,7 +262,7 @@ class BotData:
                 "crashed": crashed,
                 "model": (config.get("api") or {}).get("model", "?"),
                 "servers": len((config.get("discord") or {}).get("servers", [])),
-                "last_activity": last[0]["timestamp"] if last else None,
+                "last_activity": _iso_from_micros(last[0]["timestamp"]) if last else None,
                 "last_channel": (self._display(names, last[0]["channel_id"])
                                  if last else None),
                 "messages_today": today[0]["n"] if today else 0,
@@ -454,7 +478,8 @@ class BotData:
         for i in range(6, -1, -1):
             day = (datetime.now(timezone.utc) - timedelta(days=i)).date().isoformat()
             rows = _query(db, "SELECT COUNT(*) AS n FROM messages"
-                              " WHERE substr(timestamp, 1, 10) = ?", (day,))
+                              " WHERE timestamp >= ? AND timestamp < ?",
+                          (_day_start_micros(i), _day_start_micros(i - 1)))
             per_day.append({"d": day, "msgs": rows[0]["n"] if rows else 0})
 
         mem_dir = self.root.memories_dir(bot_id)
@@ -582,7 +607,7 @@ class BotData:
             SELECT channel_id, guild_id, COUNT(*) AS total,
                    SUM(CASE WHEN timestamp >= ? THEN 1 ELSE 0 END) AS today,
                    MAX(timestamp) AS last_ts
-            FROM messages GROUP BY channel_id""", (_today_iso(),))
+            FROM messages GROUP BY channel_id""", (_day_start_micros(),))
 
         # DM rail comes from the registry (a DM exists the moment it's
         # registered, messages or not); activity joins in from messages.db
@@ -598,7 +623,8 @@ class BotData:
                 "user_id": r["user_id"],
                 "name": meta["name"] if meta else f"DM {r['user_id']}",
                 "activity_today": act["today"] if act else 0,
-                "last_activity": act["last_ts"] if act else r["last_message_at"],
+                "last_activity": (_iso_from_micros(act["last_ts"]) if act
+                                  else r["last_message_at"]),
             })
 
         servers: dict = {}
@@ -616,13 +642,15 @@ class BotData:
                 entry["channels"].append({
                     "id": cid, "name": t["name"] or cid, "kind": "thread",
                     "parent_id": t["parent_id"],
-                    "activity_today": r["today"], "last_activity": r["last_ts"]})
+                    "activity_today": r["today"],
+                    "last_activity": _iso_from_micros(r["last_ts"])})
             else:
                 meta = names.get(cid)
                 entry["channels"].append({
                     "id": cid, "name": meta["name"] if meta else cid,
                     "kind": "channel", "parent_id": None,
-                    "activity_today": r["today"], "last_activity": r["last_ts"]})
+                    "activity_today": r["today"],
+                    "last_activity": _iso_from_micros(r["last_ts"])})
 
         for s in servers.values():
             s["channels"].sort(key=lambda c: c["last_activity"] or "", reverse=True)
@@ -647,7 +675,7 @@ class BotData:
         if before:
             msg_sql += " AND timestamp < ?"
             ev_sql += " AND ts < ?"
-            msg_params.append(before)
+            msg_params.append(_micros(datetime.fromisoformat(before)))
             ev_params.append(before)
         msg_sql += " ORDER BY timestamp DESC LIMIT ?"
         ev_sql += " ORDER BY ts DESC LIMIT ?"
@@ -657,7 +685,7 @@ class BotData:
         items = [{
             "type": "message",
             "id": r["message_id"],
-            "ts": r["timestamp"],
+            "ts": _iso_from_micros(r["timestamp"]),
             "author": r["author_name"],
             "author_id": r["author_id"],
             "is_bot": bool(r["is_bot"]),
@@ -8,6 +8,7 @@ Provides Claude with tools to:
 """
 
 import logging
+from contextlib import aclosing
 from typing import List, Dict, Optional, TYPE_CHECKING
 
 from core.internal_constants import format_size
@@ -230,17 +231,21 @@ class DiscordToolExecutor:
                     return "Error: start_time required for 'range' mode (ISO format)"
 
                 start_time = datetime.fromisoformat(start_time_str)
-                messages = await self.message_memory.get_since(
+                end_time = datetime.fromisoformat(end_time_str) if end_time_str else None
+
+                # Oldest-first stream: stop at end_time or limit instead of
+                # loading everything since start_time
+                messages = []
+                async with aclosing(self.message_memory.get_since(
                     channel_id=channel_id,
                     since=start_time
-                )
-
-                # Apply end_time filter if provided
-                if end_time_str:
-                    end_time = datetime.fromisoformat(end_time_str)
-                    messages = [msg for msg in messages if msg.timestamp <= end_time]
-
-                messages = messages[:limit]
+                )) as stream:
+                    async for msg in stream:
+                        if end_time is not None and msg.timestamp > end_time:
+                            break
+                        messages.append(msg)
+                        if len(messages) >= limit:
+                            break
                 header = f"Messages from {start_time_str} to {end_time_str or 'now'} ({len(messages)} found):\n"
 
             else: